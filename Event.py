@@ -1,7 +1,9 @@
-from datetime import timedelta
+import itertools
+from dataclasses import dataclass
+from typing import Callable
 
-from entities import Family, create_family, create_teen_group, create_single_visitor, SubGroup, TeenGroup
-from facilities import Pipes_River, Snorkel_Tour
+from entities import Family, create_family, create_teen_group, create_single_visitor, TeenGroup
+from facilities import MINUTES_PER_DAY
 from sampling_algorithms import Sampling_Algorithms
 
 
@@ -9,16 +11,46 @@ class Event:
     """
     Base class for all simulation events.
     Events are ordered by time in priority queue.
+    Simultaneous events are handled in creation order (FIFO).
     """
 
+    __slots__ = ('time', 'seq')  # No per-event __dict__ (many short-lived events)
+
+    _seq_counter = itertools.count()  # Shared creation counter for tiebreaks
+    cancelled = False  # Cancelled events are skipped by the simulation loop
+
+    _pool = None  # Freelist of handled events for reuse (subclasses opt in with [])
+    MAX_POOL_SIZE = 256  # Max recycled events kept per class
+
+    def __new__(cls, *args, **kwargs):
+        """Reuse a handled event from the class freelist when one is available."""
+        pool = cls._pool
+        if pool:
+            return pool.pop()
+        return super().__new__(cls)
+
+    @staticmethod
+    def clear_pools():
+        """Empty every event freelist (pooled events still reference the last simulation's visitors)."""
+        classes = [Event]
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+            pool = cls.__dict__.get('_pool')
+            if pool:
+                pool.clear()
+
     def __init__(self, time):
-        self.time = time  # DateTime when event should occur
+        self.time = time  # Simulation minutes when event should occur
+        self.seq = next(Event._seq_counter)  # Creation order (tiebreaker)
 
     def __lt__(self, other):
         """Comparison operator for priority queue ordering."""
-        if self.time == other.time:
-            return id(self) < id(other)  # Deterministic tiebreaker
-        return self.time < other.time
+        t1 = self.time
+        t2 = other.time
+        if t1 != t2:
+            return t1 < t2
+        return self.seq < other.seq  # Deterministic FIFO tiebreaker
 
     def handle(self, simulation):
         """Process event (must be implemented by subclasses)."""
@@ -29,103 +61,63 @@ class Event:
 # ARRIVAL EVENTS
 # ============================================
 
-class FamilyArrivalEvent(Event):
+@dataclass(frozen=True)
+class ArrivalSpec:
     """
-    Family arrival event.
-    Families arrive 09:00-12:00 with exponential inter-arrival time (40/hour).
+    Arrival stream for one visitor type.
+    factory(arrival_time, initial_rating) creates the visitor, sampler draws the next inter-arrival time
+    (minutes), and arrivals continue while the clock is at or before
+    last_arrival_minute (minute of day).
     """
+    name: str
+    factory: Callable
+    sampler: Callable
+    last_arrival_minute: int
 
-    def handle(self, simulation):
-        simulation.clock = self.time
 
-        # Create new family
-        visitor = create_family(self.time)
-        simulation.total_entities_arrived += 1
-        simulation.total_people_arrived += visitor.group_size
+# Families arrive 09:00-12:00 with exponential inter-arrival time (40/hour)
+FAMILY_ARRIVALS = ArrivalSpec("Family", create_family,
+                              Sampling_Algorithms.sample_family_interarrival_time, 11 * 60 + 59)
 
-        # Check if reception clerk available
-        clerk = simulation.reception.get_available_clerk(self.time)
-        if clerk is not None and simulation.queue_reception.size() == 0:
-            # Clerk available and no queue - start service immediately
-            simulation.reception.clerks_busy[clerk] = True
-            service_minutes = simulation.reception.get_total_service_duration()
-            end_time = self.time + timedelta(minutes=service_minutes)
-            simulation.add_event(EndReceptionEvent(end_time, visitor, clerk))
-        else:
-            # All clerks busy or queue exists - join queue
-            simulation.queue_reception.add(visitor, self.time)
+# Teen groups arrive 10:00-16:00 with exponential inter-arrival (500/day)
+TEENS_ARRIVALS = ArrivalSpec("Teens", create_teen_group,
+                             Sampling_Algorithms.sample_teens_group_interarrival_time, 15 * 60 + 59)
 
-        # Schedule next family arrival (exponential inter-arrival)
-        dt_min = Sampling_Algorithms.sample_family_interarrival_time()
-        next_time = self.time + timedelta(minutes=dt_min)
-        if next_time.hour < 12:  # Only until 12:00
-            simulation.add_event(FamilyArrivalEvent(next_time))
+# Single visitors arrive 09:00-18:30 with exponential inter-arrival (40/hour)
+SINGLE_ARRIVALS = ArrivalSpec("Single", create_single_visitor,
+                              Sampling_Algorithms.sample_single_visitor_interarrival_time, 18 * 60 + 30)
 
 
-class TeensGroupArrivalEvent(Event):
+class ArrivalEvent(Event):
     """
-    Teen group arrival event.
-    Teen groups arrive 10:00-16:00 with exponential inter-arrival (500/day).
+    Visitor arrival event (one class for all visitor types, see ArrivalSpec).
+    Creates the visitor, sends it to reception and schedules the next arrival.
     """
 
-    def handle(self, simulation):
-        simulation.clock = self.time
-
-        # Create new teen group
-        visitor = create_teen_group(self.time)
-        simulation.total_entities_arrived += 1
-        simulation.total_people_arrived += visitor.group_size
-
-        # Check if reception clerk available
-        clerk = simulation.reception.get_available_clerk(self.time)
-        if clerk is not None and simulation.queue_reception.size() == 0:
-            # Clerk available and no queue - start service immediately
-            simulation.reception.clerks_busy[clerk] = True
-            service_minutes = simulation.reception.get_total_service_duration()
-            end_time = self.time + timedelta(minutes=service_minutes)
-            simulation.add_event(EndReceptionEvent(end_time, visitor, clerk))
-        else:
-            # All clerks busy or queue exists - join queue
-            simulation.queue_reception.add(visitor, self.time)
-
-        # Schedule next teen group arrival (exponential inter-arrival)
-        dt_min = Sampling_Algorithms.sample_teens_group_interarrival_time()
-        next_time = self.time + timedelta(minutes=dt_min)
-        if next_time.hour < 16:  # Only until 16:00
-            simulation.add_event(TeensGroupArrivalEvent(next_time))
-
+    __slots__ = ('spec',)
+    _pool = []  # Recycled by Simulation.run() after handling
 
-class SingleGroupArrivalEvent(Event):
-    """
-    Single visitor arrival event.
-    Single visitors arrive 09:00-18:30 with exponential inter-arrival (40/hour).
-    """
+    def __init__(self, time, spec):
+        super().__init__(time)
+        self.spec = spec
 
     def handle(self, simulation):
-        simulation.clock = self.time
+        now = self.time
+        spec = self.spec
+        simulation.clock = now
 
-        # Create new single visitor
-        visitor = create_single_visitor(self.time)
+        # Create new visitor
+        visitor = spec.factory(now, simulation.visitor_initial_rating)
         simulation.total_entities_arrived += 1
-        simulation.total_people_arrived += 1
+        simulation.total_people_arrived += visitor.group_size
 
-        # Check if reception clerk available
-        clerk = simulation.reception.get_available_clerk(self.time)
-        if clerk is not None and simulation.queue_reception.size() == 0:
-            # Clerk available and no queue - start service immediately
-            simulation.reception.clerks_busy[clerk] = True
-            service_minutes = simulation.reception.get_total_service_duration()
-            end_time = self.time + timedelta(minutes=service_minutes)
-            simulation.add_event(EndReceptionEvent(end_time, visitor, clerk))
-        else:
-            # All clerks busy or queue exists - join queue
-            simulation.queue_reception.add(visitor, self.time)
+        # Start reception service or join reception queue
+        simulation._admit_to_reception(visitor, now)
 
-        # Schedule next single visitor arrival (exponential inter-arrival)
-        dt_min = Sampling_Algorithms.sample_single_visitor_interarrival_time()
-        next_time = self.time + timedelta(minutes=dt_min)
-        if next_time.hour < 18 or (next_time.hour == 18 and next_time.minute <= 30):  # Until 18:30
-            simulation.add_event(SingleGroupArrivalEvent(next_time))
+        # Schedule next arrival of this type (exponential inter-arrival)
+        next_time = now + spec.sampler()
+        if int(next_time % MINUTES_PER_DAY) <= spec.last_arrival_minute:
+            simulation.add_event(ArrivalEvent(next_time, spec))
 
 
 # ============================================
@@ -138,6 +130,9 @@ class EndReceptionEvent(Event):
     Calculates revenue and sends visitor to first facility.
     """
 
+    __slots__ = ('visitor', 'clerk_index')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor, clerk_index):
         super().__init__(time)
         self.visitor = visitor
@@ -147,25 +142,12 @@ class EndReceptionEvent(Event):
         simulation.clock = self.time
 
         # Free up clerk
-        simulation.reception.clerks_busy[self.clerk_index] = False
+        simulation.reception.release_clerk(self.clerk_index)
         simulation.total_entities_entered += 1
         simulation.total_people_entered += self.visitor.group_size
 
         # Calculate revenue based on visitor type
-        if isinstance(self.visitor, Family):
-            # Family: 2 adults @ 150₪ + kids @ 75₪
-            adults = 2
-            kids = self.visitor.num_kids
-            revenue = adults * 150 + kids * 75
-            if self.visitor.has_express_pass:
-                revenue += (adults + kids) * 50  # Express pass: 50₪ per person
-            simulation.total_revenue += revenue
-        else:
-            # Teen group or single visitor: 150₪ per person
-            revenue = self.visitor.group_size * 150
-            if self.visitor.has_express_pass:
-                revenue += self.visitor.group_size * 50
-            simulation.total_revenue += revenue
+        simulation.total_revenue += self.visitor.compute_entry_revenue()
 
         # Try to find the first facility.
         first_facility = simulation.choose_facility(self.visitor, is_first_visit=True)
@@ -176,17 +158,14 @@ class EndReceptionEvent(Event):
         else:
             # Option B: No facility found -> EXIT PARK IMMEDIATELY
             self.visitor.update_rating_negative(0.5)
-            simulation.visitors_completed.append(self.visitor)
-            simulation.ratings.append(self.visitor.rating)
-            simulation.total_entities_completed += 1
-            simulation.total_people_completed += self.visitor.group_size
+            simulation._complete_visitor(self.visitor, buy_photos=False)
 
         # Process next visitor in reception queue
         if simulation.queue_reception.size() > 0:
             next_visitor, arrival_time = simulation.queue_reception.pop(self.time)
-            simulation.reception.clerks_busy[self.clerk_index] = True
+            simulation.reception.assign_clerk(self.clerk_index)
             service_minutes = simulation.reception.get_total_service_duration()
-            end_time = self.time + timedelta(minutes=service_minutes)
+            end_time = self.time + service_minutes
             simulation.add_event(EndReceptionEvent(end_time, next_visitor, self.clerk_index))
 
 
@@ -197,34 +176,42 @@ class EndReceptionEvent(Event):
 class ArriveAtFacilityEvent(Event):
     """
     Event when visitor arrives at facility and joins queue.
-    Creates abandonment event for non-express visitors.
+    Creates abandonment event for non-express visitors left waiting.
     """
 
+    __slots__ = ('visitor', 'facility')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor, facility):
         super().__init__(time)
         self.visitor = visitor
         self.facility = facility
 
     def handle(self, simulation):
-        simulation.clock = self.time
+        now = self.time
+        visitor = self.visitor
+        facility = self.facility
+        simulation.clock = now
 
         # Add to appropriate queue (express or regular)
-        if self.visitor.has_express_pass:
-            self.facility.queue_express.add(self.visitor, self.time)
+        if visitor.has_express_pass:
+            facility.queue_express.add(visitor, now)
         else:
-            self.facility.queue_regular.add(self.visitor, self.time)
+            facility.queue_regular.add(visitor, now)
 
         # Record queue entry time
-        self.visitor.time_entered_queue = self.time
-
-        # Schedule abandonment event for non-express visitors
-        if not self.visitor.has_express_pass:
-            threshold = self.visitor.get_abandonment_threshold()
-            simulation.add_event(
-                AbandonmentEvent(self.time + timedelta(minutes=threshold), self.visitor, self.facility))
+        visitor.time_entered_queue = now
 
         # Try to start service immediately if possible
-        simulation.try_start_facility(self.facility, self.time)
+        facility.try_start(simulation, now)
+
+        # Schedule abandonment event for non-express visitors still waiting
+        # (visitors served on arrival never need one)
+        if not visitor.has_express_pass and visitor in facility.queue_regular:
+            threshold = visitor.get_abandonment_threshold()
+            abandonment = AbandonmentEvent(now + threshold, visitor, facility)
+            visitor.pending_abandonment = abandonment  # Cancelled if service starts first
+            simulation.add_event(abandonment)
 
 
 class EndFacilityEvent(Event):
@@ -233,6 +220,9 @@ class EndFacilityEvent(Event):
     Handles rating updates, departure checks, and routing to next activity.
     """
 
+    __slots__ = ('visitor', 'facility', 'instructor_idx')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor, facility, instructor_idx=None):
         super().__init__(time)
         self.visitor = visitor
@@ -241,63 +231,48 @@ class EndFacilityEvent(Event):
 
     def handle(self, simulation):
         simulation.clock = self.time
+        self.finish_visitor(simulation, self.visitor)
+
+    def finish_visitor(self, simulation, visitor):
+        """Release visitor from the facility, rate the ride and route them onward."""
+        now = self.time
+        facility = self.facility
 
         # Remove visitor from facility
-        if self.visitor in self.facility.users_in_service:
-            self.facility.users_in_service.remove(self.visitor)
+        facility.remove_user(visitor)
 
         # Mark facility as visited
-        if hasattr(self.visitor, 'visited_facilities'):
-            if self.facility not in self.visitor.visited_facilities:
-                self.visitor.visited_facilities.append(self.facility)
-
-        # Special cleanup for specific facilities
-        if isinstance(self.facility, Pipes_River):
-            # Release tubes (handles shared tube logic)
-            self.facility.release_tubes(self.visitor)
-
-        elif isinstance(self.facility, Snorkel_Tour) and self.instructor_idx is not None:
-            # Send instructor on break after tour
-            self.facility.finish_tour(self.instructor_idx, self.time)
-            simulation.add_event(
-                InstructorBreakEndEvent(self.time + timedelta(minutes=30), self.instructor_idx, self.facility))
+        visitor.visited_facilities.add(facility)
+        visitor.visited_mask |= facility.mask_bit
+
+        # Special cleanup for specific facilities (tube release, instructor break)
+        facility.on_visitor_finished(visitor, now, simulation, self.instructor_idx)
 
         # Update visitor rating based on experience
         if Sampling_Algorithms.had_good_experience():
             # Good experience: rating increases
-            self.visitor.update_rating_positive(self.visitor.group_size, self.facility.adrenalin_level)
+            visitor.update_rating_positive(visitor.group_size, facility.adrenalin_level)
         else:
             # Bad experience: rating decreases slightly
-            self.visitor.update_rating_negative(0.1)
+            visitor.update_rating_negative(0.1)
 
         # --- NEW SPLITTING LOGIC (Moved here from Reception) ---
-        entities_to_process = [self.visitor]  # Default: continue as is
+        entities_to_process = [visitor]  # Default: continue as is
 
         # If it's a full Family, check if they should split now (after first ride)
-        if isinstance(self.visitor, Family):
-            split_result = self.visitor.check_and_split()  # Returns list of subgroups or [self]
+        if isinstance(visitor, Family) and not visitor.split_decided:
+            split_result = visitor.check_and_split()  # Returns list of subgroups or [self]
             if len(split_result) > 1:
                 entities_to_process = split_result  # Logic split happened!
 
         # --- Process Next Step for each entity ---
         for entity in entities_to_process:
 
-            # A. Determine Departure Time
-            current_departure_time = None
-            if isinstance(entity, SubGroup):
-                current_departure_time = entity.parent_family.departure_time
-            else:
-                current_departure_time = entity.departure_time
-
+            # A. Check Departure Time (precomputed on arrival, shared by subgroups)
             should_leave = False
-
-            # Check Time
-            if current_departure_time:
-                dep_hour = int(current_departure_time)
-                dep_min = int((current_departure_time % 1) * 60)
-                dep_dt = simulation.clock.replace(hour=dep_hour, minute=dep_min, second=0)
-                if simulation.clock >= dep_dt:
-                    should_leave = True
+            departure_minutes = entity.departure_minutes
+            if departure_minutes is not None and simulation.clock >= departure_minutes:
+                should_leave = True
 
             # B. Try to find next facility
             next_facility = None
@@ -309,38 +284,13 @@ class EndFacilityEvent(Event):
             # C. Execute Move (Leave or Next Facility)
             if should_leave:
                 # --- EXIT LOGIC ---
-                if isinstance(entity, (Family, SubGroup)):
-                    original = entity if isinstance(entity, Family) else entity.parent_family
-
-                    if isinstance(entity, SubGroup):
-                        original.active_subgroups_count -= 1
-                    else:
-                        original.active_subgroups_count = 0
-
-                    # Only "Complete" the family if everyone is out
-                    if original.active_subgroups_count == 0:
-                        package, price = Sampling_Algorithms.get_photo_purchase_decision(original.rating)
-                        if package:
-                            simulation.total_revenue += price
-                        simulation.visitors_completed.append(original)
-                        simulation.ratings.append(original.rating)
-                        simulation.total_entities_completed += 1
-                        simulation.total_people_completed += original.group_size
-                else:
-                    # Single/Teen exit
-                    package, price = Sampling_Algorithms.get_photo_purchase_decision(entity.rating)
-                    if package:
-                        simulation.total_revenue += price
-                    simulation.visitors_completed.append(entity)
-                    simulation.ratings.append(entity.rating)
-                    simulation.total_entities_completed += 1
-                    simulation.total_people_completed += entity.group_size
+                # Families complete only once every subgroup is out
+                entity.leave_park(simulation)
 
             else:
                 # --- NEXT FACILITY / LUNCH ---
                 # Check for Lunch (13:00-15:00)
-                current_hour = self.time.hour + self.time.minute / 60
-                if 13 <= current_hour < 15 and Sampling_Algorithms.should_eat_lunch():
+                if 13 * 60 <= now % MINUTES_PER_DAY < 15 * 60 and Sampling_Algorithms.should_eat_lunch():
                     restaurant_choice = Sampling_Algorithms.choose_restaurant()
                     if restaurant_choice == "burger":
                         restaurant = simulation.burger_Restaurant
@@ -348,9 +298,31 @@ class EndFacilityEvent(Event):
                         restaurant = simulation.pizza_Restaurant
                     else:
                         restaurant = simulation.salad_Restaurant
-                    simulation.add_event(ArriveAtRestaurantEvent(self.time, entity, restaurant))
+                    simulation.add_event(ArriveAtRestaurantEvent(now, entity, restaurant))
                 else:
-                    simulation.add_event(ArriveAtFacilityEvent(self.time, entity, next_facility))
+                    simulation.add_event(ArriveAtFacilityEvent(now, entity, next_facility))
+
+
+class BatchEndFacilityEvent(EndFacilityEvent):
+    """
+    Event when a whole slide batch (Big/Small Pipes) finishes together.
+    One heap entry for the batch; visitors are finished in boarding order.
+    """
+
+    __slots__ = ('batch',)
+    _pool = []  # Recycled by Simulation.run() after handling
+
+    def __init__(self, time, batch, facility):
+        Event.__init__(self, time)
+        self.batch = batch
+        self.visitor = None
+        self.facility = facility
+        self.instructor_idx = None
+
+    def handle(self, simulation):
+        simulation.clock = self.time
+        for visitor in self.batch:
+            self.finish_visitor(simulation, visitor)
 
 
 # ============================================
@@ -363,67 +335,67 @@ class AbandonmentEvent(Event):
     Only triggers if visitor is still in queue (wasn't served yet).
     """
 
+    __slots__ = ('visitor', 'facility', 'cancelled')
+    # Safe to recycle: cancel_abandonment() and handle() both clear visitor.pending_abandonment,
+    # so no visitor still points at an abandonment event once it reaches the freelist
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor, facility):
         super().__init__(time)
         self.visitor = visitor
         self.facility = facility
+        self.cancelled = False  # Set when visitor starts service first
 
     def handle(self, simulation):
-        simulation.clock = self.time
+        now = self.time
+        visitor = self.visitor
+        facility = self.facility
+        simulation.clock = now
+
+        if visitor.pending_abandonment is self:
+            visitor.pending_abandonment = None
 
         # Check if visitor is still in queue
-        visitor_in_regular = any(v == self.visitor for v in self.facility.queue_regular)
-        visitor_in_express = any(v == self.visitor for v in self.facility.queue_express)
+        visitor_in_regular = visitor in facility.queue_regular
+        visitor_in_express = visitor in facility.queue_express
 
         if not visitor_in_regular and not visitor_in_express:
             return  # Visitor already started service - cancel event
 
         # Remove from queue
         if visitor_in_regular:
-            self.facility.queue_regular.remove(self.visitor, self.time)
+            facility.queue_regular.remove(visitor, now)
         else:
-            self.facility.queue_express.remove(self.visitor, self.time)
+            facility.queue_express.remove(visitor, now)
 
         # Update rating (abandonment penalty)
-        self.visitor.update_rating_negative(0.8)
+        visitor.update_rating_negative(0.8)
 
         # Special handling for teen groups
-        if isinstance(self.visitor, TeenGroup):
-            action = self.visitor.handle_abandonment(self.facility)
+        if isinstance(visitor, TeenGroup):
+            action = visitor.handle_abandonment(facility)
 
             if action == "buy_express_and_return":
                 # Teen group bought express pass - return to SAME facility with express queue
-                simulation.total_revenue += 50 * self.visitor.group_size
-                simulation.add_event(ArriveAtFacilityEvent(self.time, self.visitor, self.facility))
+                simulation.total_revenue += 50 * visitor.group_size
+                simulation.add_event(ArriveAtFacilityEvent(now, visitor, facility))
             else:
                 # Didn't buy express - move to next facility
-                next_facility = simulation.choose_facility(self.visitor, is_first_visit=False)
+                next_facility = simulation.choose_facility(visitor, is_first_visit=False)
                 if next_facility:
-                    simulation.add_event(ArriveAtFacilityEvent(self.time, self.visitor, next_facility))
+                    simulation.add_event(ArriveAtFacilityEvent(now, visitor, next_facility))
                 else:
                     # No more facilities - leave park
-                    package, price = Sampling_Algorithms.get_photo_purchase_decision(self.visitor.rating)
-                    if package:
-                        simulation.total_revenue += price
-                    simulation.ratings.append(self.visitor.rating)
-                    simulation.visitors_completed.append(self.visitor)
-                    simulation.total_entities_completed += 1
-                    simulation.total_people_completed += self.visitor.group_size
+                    simulation._complete_visitor(visitor)
 
         else:
             # Other visitor types: move to next facility
-            next_facility = simulation.choose_facility(self.visitor, is_first_visit=False)
+            next_facility = simulation.choose_facility(visitor, is_first_visit=False)
             if next_facility:
-                simulation.add_event(ArriveAtFacilityEvent(self.time, self.visitor, next_facility))
+                simulation.add_event(ArriveAtFacilityEvent(now, visitor, next_facility))
             else:
                 # No more facilities - leave park
-                package, price = Sampling_Algorithms.get_photo_purchase_decision(self.visitor.rating)
-                if package:
-                    simulation.total_revenue += price
-                simulation.ratings.append(self.visitor.rating)
-                simulation.visitors_completed.append(self.visitor)
-                simulation.total_entities_completed += 1
-                simulation.total_people_completed += self.visitor.group_size
+                simulation._complete_visitor(visitor)
 
 
 # ============================================
@@ -433,6 +405,9 @@ class AbandonmentEvent(Event):
 class ArriveAtRestaurantEvent(Event):
     """Event when visitor arrives at restaurant to order food."""
 
+    __slots__ = ('visitor', 'restaurant')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor, restaurant):
         super().__init__(time)
         self.visitor = visitor
@@ -448,13 +423,16 @@ class ArriveAtRestaurantEvent(Event):
             # Start service immediately
             self.restaurant.stations_busy[station] = True
             total_time = self.restaurant.get_total_time(self.visitor)
-            end_time = self.time + timedelta(minutes=total_time)
+            end_time = self.time + total_time
             simulation.add_event(EndRestaurantServiceEvent(end_time, self.visitor, self.restaurant, station))
 
 
 class EndRestaurantServiceEvent(Event):
     """Event when visitor receives food and starts eating."""
 
+    __slots__ = ('visitor', 'restaurant', 'station')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor, restaurant, station):
         super().__init__(time)
         self.visitor = visitor
@@ -477,20 +455,23 @@ class EndRestaurantServiceEvent(Event):
 
         # Visitor starts eating
         meal_duration = self.restaurant.get_meal_duration()
-        simulation.add_event(EndMealEvent(self.time + timedelta(minutes=meal_duration), self.visitor))
+        simulation.add_event(EndMealEvent(self.time + meal_duration, self.visitor))
 
         # Process next visitor in restaurant queue
         if self.restaurant.queue.size() > 0:  # ✅ CHANGED: Use .size() instead of len()
             next_visitor, arrival_time = self.restaurant.queue.pop(self.time)  # ✅ CHANGED: Use .pop() instead of .popleft()
             self.restaurant.stations_busy[self.station] = True
             total_time = self.restaurant.get_total_time(next_visitor)
-            end_time = self.time + timedelta(minutes=total_time)
+            end_time = self.time + total_time
             simulation.add_event(EndRestaurantServiceEvent(end_time, next_visitor, self.restaurant, self.station))
 
 
 class EndMealEvent(Event):
     """Event when visitor finishes eating and resumes park activities."""
 
+    __slots__ = ('visitor',)
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, visitor):
         super().__init__(time)
         self.visitor = visitor
@@ -498,70 +479,19 @@ class EndMealEvent(Event):
     def handle(self, simulation):
         simulation.clock = self.time
 
-        # Get departure time correctly based on visitor type
-        if isinstance(self.visitor, SubGroup):
-            departure_time_val = self.visitor.parent_family.departure_time
-        else:
-            departure_time_val = self.visitor.departure_time
-
-        # Check if it's time to leave
-        if departure_time_val:
-            departure_hour = int(departure_time_val)
-            departure_minute = int((departure_time_val % 1) * 60)
-            departure_datetime = simulation.clock.replace(hour=departure_hour, minute=departure_minute, second=0)
-
-            if simulation.clock >= departure_datetime:
-                # Time to leave
-                if isinstance(self.visitor, (Family, SubGroup)):
-                    original_family = self.visitor if isinstance(self.visitor, Family) else self.visitor.parent_family
-                    original_family.active_subgroups_count -= 1
-
-                    if original_family.active_subgroups_count == 0:
-                        package, price = Sampling_Algorithms.get_photo_purchase_decision(original_family.rating)
-                        if package:
-                            simulation.total_revenue += price
-                        simulation.ratings.append(original_family.rating)
-                        simulation.visitors_completed.append(original_family)
-                        simulation.total_entities_completed += 1
-                        simulation.total_people_completed += original_family.group_size
-
-                else:
-                    package, price = Sampling_Algorithms.get_photo_purchase_decision(self.visitor.rating)
-                    if package:
-                        simulation.total_revenue += price
-                    simulation.ratings.append(self.visitor.rating)
-                    simulation.visitors_completed.append(self.visitor)
-                    simulation.total_entities_completed += 1
-                    simulation.total_people_completed += self.visitor.group_size
-
-                return
+        # Check if it's time to leave (departure precomputed on arrival)
+        departure_minutes = self.visitor.departure_minutes
+        if departure_minutes is not None and simulation.clock >= departure_minutes:
+            # Time to leave
+            self.visitor.leave_park(simulation)
+            return
 
         # Check if finished all facilities
         next_facility = simulation.choose_facility(self.visitor, is_first_visit=False)
 
         if next_facility is None:
             # Finished all facilities - leave
-            if isinstance(self.visitor, (Family, SubGroup)):
-                original_family = self.visitor if isinstance(self.visitor, Family) else self.visitor.parent_family
-                original_family.active_subgroups_count -= 1
-
-                if original_family.active_subgroups_count == 0:
-                    package, price = Sampling_Algorithms.get_photo_purchase_decision(original_family.rating)
-                    if package:
-                        simulation.total_revenue += price
-                    simulation.ratings.append(original_family.rating)
-                    simulation.visitors_completed.append(original_family)
-                    simulation.total_entities_completed += 1
-                    simulation.total_people_completed += original_family.group_size
-
-            else:
-                package, price = Sampling_Algorithms.get_photo_purchase_decision(self.visitor.rating)
-                if package:
-                    simulation.total_revenue += price
-                simulation.ratings.append(self.visitor.rating)
-                simulation.visitors_completed.append(self.visitor)
-                simulation.total_entities_completed += 1
-                simulation.total_people_completed += self.visitor.group_size
+            self.visitor.leave_park(simulation)
 
         else:
             # Continue to next facility
@@ -575,6 +505,9 @@ class EndMealEvent(Event):
 class InstructorBreakEndEvent(Event):
     """Event when snorkel instructor finishes break."""
 
+    __slots__ = ('instructor_idx', 'facility')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, instructor_idx, facility):
         super().__init__(time)
         self.instructor_idx = instructor_idx
@@ -584,31 +517,28 @@ class InstructorBreakEndEvent(Event):
         simulation.clock = self.time
 
         # Instructor finishes break (may go to lunch if it's lunch time)
-        goes_to_lunch = self.facility.finish_break(self.instructor_idx, self.time)
-
-        # If instructor goes to lunch, create lunch end event
-        if goes_to_lunch:
-            # Calculate remaining time until 14:00
-            current_minutes = self.time.hour * 60 + self.time.minute
-            lunch_end = 14 * 60  # 14:00 in minutes
-            remaining_lunch_time = lunch_end - current_minutes
-
-            if remaining_lunch_time > 0:
-                simulation.add_event(
-                    InstructorLunchEndEvent(
-                        self.time + timedelta(minutes=remaining_lunch_time),
-                        self.instructor_idx,
-                        self.facility
-                    )
+        remaining_lunch_time = self.facility.finish_break(self.instructor_idx, self.time)
+
+        # If instructor goes to lunch, create lunch end event (at 14:00)
+        if remaining_lunch_time:
+            simulation.add_event(
+                InstructorLunchEndEvent(
+                    self.time + remaining_lunch_time,
+                    self.instructor_idx,
+                    self.facility
                 )
+            )
         else:
             # Not lunch time - try to start new tour if instructor available
-            simulation.try_start_facility(self.facility, self.time)
+            self.facility.try_start(simulation, self.time)
 
 
 class InstructorLunchEndEvent(Event):
     """Event when snorkel instructor finishes lunch break."""
 
+    __slots__ = ('instructor_idx', 'facility')
+    _pool = []  # Recycled by Simulation.run() after handling
+
     def __init__(self, time, instructor_idx, facility):
         super().__init__(time)
         self.instructor_idx = instructor_idx
@@ -621,7 +551,7 @@ class InstructorLunchEndEvent(Event):
         self.facility.finish_lunch(self.instructor_idx)
 
         # Try to start new tour
-        simulation.try_start_facility(self.facility, self.time)
+        self.facility.try_start(simulation, self.time)
 
 
 class VisitorDepartureEvent(Event):
@@ -630,73 +560,52 @@ class VisitorDepartureEvent(Event):
     (Currently not used - departure handled in EndFacilityEvent/EndMealEvent)
     """
 
+    __slots__ = ('visitor',)
+
     def __init__(self, time, visitor):
         super().__init__(time)
         self.visitor = visitor
 
     def handle(self, simulation):
         simulation.clock = self.time
-
-        # Process photo purchase
-        package, price = Sampling_Algorithms.get_photo_purchase_decision(self.visitor.rating)
-        if package:
-            simulation.total_revenue += price
-
-        # Record rating and completion
-        simulation.ratings.append(self.visitor.rating)
-        simulation.visitors_completed.append(self.visitor)
+        simulation._complete_visitor(self.visitor)  # Photo purchase, rating and completion
 
 
 class EndOfDayEvent(Event):
     """Closes daily statistics for all queues once per day and schedules the next day closure."""
 
+    __slots__ = ('park_close_hour', 'park_close_minute')
+
     def __init__(self, time, park_close_hour=19, park_close_minute=0):
         super().__init__(time)
         self.park_close_hour = park_close_hour
         self.park_close_minute = park_close_minute
 
     def handle(self, simulation):
-        simulation.clock = self.time
-        day_start = self.time.replace(hour=9, minute=0, second=0, microsecond=0)
-
-        # 1) Reception queue daily stats
-        q = simulation.queue_reception
-
-        if not q.queue_change_times:
-            q.queue_change_times = [self.time.replace(hour=9, minute=0, second=0, microsecond=0)]
-            q.queue_lengths = [q.size()]
-
-        q.record_queue_length(self.time)
-        q.calc_daily_statistics()
-
-        # 2) Facility queues daily stats
-        for f in simulation.facilities:
-            for q in [f.queue_regular, f.queue_express]:
-                if not q.queue_change_times:
-                    q.queue_change_times = [day_start]
-                    q.queue_lengths = [q.size()]
-
-                q.record_queue_length(self.time)
-                q.calc_daily_statistics()
+        now = self.time
+        simulation.clock = now
+        midnight = now - now % MINUTES_PER_DAY
+        day_start = midnight + 9 * 60  # 09:00 today
 
-        # 3) Restaurant queues daily stats ✅ NEW!
-        for restaurant in simulation.restaurants:
-            q = restaurant.queue
+        # Reception, facility and restaurant queues daily stats (list built once by Simulation)
+        for q in simulation.stat_queues:
             if not q.queue_change_times:
+                if not q:
+                    q.record_idle_day()  # Empty all day - averages are zero
+                    continue
                 q.queue_change_times = [day_start]
                 q.queue_lengths = [q.size()]
 
-            q.record_queue_length(self.time)
+            q.record_queue_length(now)
             q.calc_daily_statistics()
 
         # --- Schedule next day arrivals ---
-        next_day_start = (self.time + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+        next_day_start = day_start + MINUTES_PER_DAY
 
-        simulation.add_event(FamilyArrivalEvent(next_day_start))
-        simulation.add_event(SingleGroupArrivalEvent(next_day_start))
-        simulation.add_event(TeensGroupArrivalEvent(next_day_start + timedelta(hours=1)))  # 10:00
+        simulation.add_event(ArrivalEvent(next_day_start, FAMILY_ARRIVALS))
+        simulation.add_event(ArrivalEvent(next_day_start, SINGLE_ARRIVALS))
+        simulation.add_event(ArrivalEvent(next_day_start + 60, TEENS_ARRIVALS))  # 10:00
 
         # Schedule next day end
-        next_day_end = (self.time + timedelta(days=1)).replace(hour=self.park_close_hour,
-                                                                 minute=self.park_close_minute, second=0, microsecond=0)
+        next_day_end = midnight + MINUTES_PER_DAY + self.park_close_hour * 60 + self.park_close_minute
         simulation.add_event(self.__class__(next_day_end, self.park_close_hour, self.park_close_minute))
\ No newline at end of file
@@ -1,5 +1,3 @@
-import numpy as np
-from datetime import datetime
 from collections import deque
 
 
@@ -10,12 +8,23 @@ class QueueServer:
     Used for both regular and express queues at all facilities.
     """
 
+    __slots__ = ('server_queue', 'members', '_live', '_people', '_odd', '_tombstones', 'active_hours',
+                 'waiting_time_sum', 'waiting_time_count', 'total_queue_length_time',
+                 'queue_lengths', 'queue_change_times',
+                 'daily_avg_queue_lengths', 'daily_avg_waiting_times')  # Fixed attributes, no __dict__
+
     def __init__(self):
-        self.server_queue = deque()  # Main queue: [(visitor, arrival_time), ...]
+        self.server_queue = deque()  # Main queue: [[visitor, arrival_time], ...] (visitor None = removed)
+        self.members = {}  # Visitor -> its live entries in server_queue (O(1) membership and removal)
+        self._live = 0  # Number of entries not removed
+        self._people = 0  # Total group size of live entries
+        self._odd = 0  # Live entries whose group size is odd
+        self._tombstones = 0  # Removed entries still in server_queue (never at the front)
         self.active_hours = 10  # Default active hours (9:00-19:00)
 
         # Statistics tracking
-        self.waiting_times = []  # List of all waiting times (minutes)
+        self.waiting_time_sum = 0.0  # Sum of today's waiting times (minutes)
+        self.waiting_time_count = 0  # Number of visitors who waited today
         self.total_queue_length_time = 0  # Area under queue length curve
         self.queue_lengths = [0]  # Queue length at each change
         self.queue_change_times = []  # Times when queue length changed
@@ -30,44 +39,53 @@ class QueueServer:
 
         Args:
             visitor: Visitor object
-            arrival_time: DateTime when visitor joined queue
+            arrival_time: Simulation time (minutes) when visitor joined queue
         """
-        self.server_queue.append([visitor, arrival_time])
+        entry = [visitor, arrival_time]
+        self.server_queue.append(entry)
+        self._track(entry)
         self.record_queue_length(arrival_time)
 
     def insert(self, index, visitor, time):
         """
         Insert visitor at specific position in queue.
-        Used for returning visitors to queue after failed batch formation.
+        Facilities peek before popping, so they no longer need this to undo a failed batch.
 
         Args:
             index: Position to insert (0 = front of queue)
             visitor: Visitor object
-            time: DateTime of insertion
+            time: Simulation time (minutes) of insertion
         """
-        temp_list = list(self.server_queue)
-        temp_list.insert(index, [visitor, time])
-        self.server_queue = deque(temp_list)
+        if self._tombstones:
+            self._compact()  # Positions must count live visitors only
+        entry = [visitor, time]
+        self.server_queue.insert(index, entry)  # In place, no copy
+        self._track(entry)
         if time is not None:
             self.record_queue_length(time)
 
     def remove(self, visitor, current_time):
         """
         Remove specific visitor from queue (e.g., for abandonment).
+        The entry is found through members and marked removed in O(1);
+        pop() and iteration skip it.
 
         Args:
             visitor: Visitor object to remove
-            current_time: DateTime of removal
+            current_time: Simulation time (minutes) of removal
         """
         self.record_queue_length(current_time)  # Record statistics before removal
 
-        # Find and remove visitor
-        for i, (v, t) in enumerate(self.server_queue):
-            if v == visitor:
-                temp_list = list(self.server_queue)
-                temp_list.pop(i)
-                self.server_queue = deque(temp_list)
-                return
+        entries = self.members.get(visitor)
+        if entries is None:
+            return
+        entry = entries[0]
+        self._untrack(entry)
+        entry[0] = None  # Tombstone
+
+        # Keep the front entry live so queue[0] and pop() stay O(1)
+        self._tombstones += 1
+        self._drop_front_tombstones()
 
     def pop(self, removing_time):
         """
@@ -75,37 +93,79 @@ class QueueServer:
         Calculates waiting time if removing_time is provided.
 
         Args:
-            removing_time: DateTime when visitor removed (None to skip statistics)
+            removing_time: Simulation time (minutes) when visitor removed (None to skip statistics)
 
         Returns:
             (visitor, arrival_time) or (None, None) if queue empty
         """
-        if self.server_queue:
-            extracted = self.server_queue.popleft()
+        if self._live:
+            extracted = self.server_queue.popleft()  # Front entry is always live
+            self._untrack(extracted)
+            self._drop_front_tombstones()
 
             if removing_time is not None:
                 # Record statistics
                 self.record_queue_length(removing_time)
 
                 # Calculate waiting time
-                wait_duration = (removing_time - extracted[1]).total_seconds() / 60  # Minutes
-                self.waiting_times.append(wait_duration)
+                wait_duration = removing_time - extracted[1]  # Minutes
+                self.waiting_time_sum += wait_duration
+                self.waiting_time_count += 1
 
             return extracted[0], extracted[1]
         return None, None
 
+    def _track(self, entry):
+        """Register a new live queue entry for its visitor."""
+        entries = self.members.get(entry[0])
+        if entries is None:
+            self.members[entry[0]] = [entry]
+        else:
+            entries.append(entry)
+        self._live += 1
+        group_size = entry[0].group_size
+        self._people += group_size
+        self._odd += group_size & 1
+
+    def _untrack(self, entry):
+        """Forget a queue entry (and the visitor once it has no entries left)."""
+        visitor = entry[0]
+        entries = self.members[visitor]
+        if len(entries) == 1:
+            del self.members[visitor]
+        else:
+            for i, e in enumerate(entries):
+                if e is entry:
+                    del entries[i]
+                    break
+        self._live -= 1
+        self._people -= visitor.group_size
+        self._odd -= visitor.group_size & 1
+
+    def _drop_front_tombstones(self):
+        """Discard removed entries that reached the front of the queue."""
+        queue = self.server_queue
+        while self._tombstones and queue and queue[0][0] is None:
+            queue.popleft()
+            self._tombstones -= 1
+
+    def _compact(self):
+        """Rebuild server_queue without removed entries."""
+        self.server_queue = deque(entry for entry in self.server_queue if entry[0] is not None)
+        self._tombstones = 0
+
     def record_queue_length(self, current_time):
         """
         Record queue length change for statistics.
         Updates area under queue length curve.
 
         Args:
-            current_time: DateTime of queue length change
+            current_time: Simulation time (minutes) of queue length change
         """
         if self.queue_lengths and self.queue_change_times:
             # Calculate time since last change
             last_time = self.queue_change_times[-1]
-            duration_hours = (current_time - last_time).total_seconds() / 3600
+            duration_hours = (current_time - last_time) / 60
 
             # Update area under curve: queue_length * time_duration
             self.total_queue_length_time += self.queue_lengths[-1] * duration_hours
@@ -116,7 +176,15 @@ class QueueServer:
 
     def size(self):
         """Return current number of visitors in queue."""
-        return len(self.server_queue)
+        return self._live
+
+    def total_people(self):
+        """Return total number of people (sum of group sizes) in queue."""
+        return self._people
+
+    def odd_groups(self):
+        """Return number of odd-sized groups in queue."""
+        return self._odd
 
     def __len__(self):
         """Support len() operator."""
@@ -126,6 +194,10 @@ class QueueServer:
         """Support boolean check (True if queue not empty)."""
         return self.size() > 0
 
+    def __contains__(self, visitor):
+        """Support 'in' operator with O(1) membership test."""
+        return visitor in self.members
+
     def __getitem__(self, index):
         """
         Support indexing: queue[0] returns first visitor.
@@ -136,7 +208,9 @@ class QueueServer:
         Returns:
             Visitor object at index
         """
-        return list(self.server_queue)[index][0]
+        if index != 0 and self._tombstones:
+            self._compact()  # Positions must count live visitors only
+        return self.server_queue[index][0]  # Index the deque directly (no copy)
 
     def __iter__(self):
         """
@@ -146,7 +220,8 @@ class QueueServer:
             Visitor objects in queue order
         """
         for visitor, time in self.server_queue:
-            yield visitor
+            if visitor is not None:  # Skip removed entries
+                yield visitor
 
     def set_active_hours(self, opening_hour, closing_hour):
         """
@@ -156,9 +231,18 @@ class QueueServer:
             opening_hour: String in format "HH:MM" (e.g., "09:00")
             closing_hour: String in format "HH:MM" (e.g., "19:00")
         """
-        fmt = '%H:%M'
-        tdelta = datetime.strptime(closing_hour, fmt) - datetime.strptime(opening_hour, fmt)
-        self.active_hours = tdelta.total_seconds() / 3600  # Convert to hours
+        open_h, open_m = map(int, opening_hour.split(':'))
+        close_h, close_m = map(int, closing_hour.split(':'))
+        active_minutes = (close_h * 60 + close_m) - (open_h * 60 + open_m)
+        self.active_hours = active_minutes / 60  # Convert to hours
+
+    def record_idle_day(self):
+        """
+        Store daily statistics for a queue that stayed empty all day.
+        Equivalent to calc_daily_statistics() with no recorded changes.
+        """
+        self.daily_avg_queue_lengths.append(0.0)
+        self.daily_avg_waiting_times.append(0)
 
     def calc_daily_statistics(self):
         """
@@ -171,11 +255,13 @@ class QueueServer:
         self.daily_avg_queue_lengths.append(daily_avg_length)
 
         # Calculate average waiting time
-        daily_avg_wait = np.mean(self.waiting_times) if self.waiting_times else 0
+        count = self.waiting_time_count
+        daily_avg_wait = self.waiting_time_sum / count if count else 0
         self.daily_avg_waiting_times.append(daily_avg_wait)
 
         # Reset daily counters
         self.total_queue_length_time = 0
         self.queue_change_times = []
         self.queue_lengths = [0]
-        self.waiting_times = []
\ No newline at end of file
+        self.waiting_time_sum = 0.0
+        self.waiting_time_count = 0
\ No newline at end of file
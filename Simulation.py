@@ -1,13 +1,13 @@
 import heapq
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import timedelta
 
-from Event import FamilyArrivalEvent, TeensGroupArrivalEvent, SingleGroupArrivalEvent, EndOfDayEvent, EndFacilityEvent
+from Event import Event, ArrivalEvent, FAMILY_ARRIVALS, TEENS_ARRIVALS, SINGLE_ARRIVALS, EndOfDayEvent, EndFacilityEvent, \
+    BatchEndFacilityEvent, EndReceptionEvent, InstructorBreakEndEvent
 from Queue import QueueServer
 from entities import SubGroup, Family, TeenGroup, SingleVisitor
 from facilities import Reception, Pipes_River, Single_Slide, Big_Pipes_Slide, Small_Pipes_Slide, Snorkel_Tour, \
-    Kids_Pool, Waves_Pool, Pizza_Restaurant, Burger_Restaurant, Salad_Restaurant
+    Kids_Pool, Waves_Pool, Pizza_Restaurant, Burger_Restaurant, Salad_Restaurant, MINUTES_PER_DAY
 from sampling_algorithms import Sampling_Algorithms
 
 
@@ -18,8 +18,16 @@ class Simulation:
     Uses discrete event simulation with priority queue.
     """
 
-    def __init__(self, start_date):
-        # Import facilities
+    # Rebuild the event heap only when more than this many cancelled events
+    # make up over half of it (same policy as asyncio's timer heap)
+    MIN_CANCELLED_EVENTS = 50
+
+    def __init__(self, start_date, visitor_initial_rating=10.0, seed=None):
+        # Start from fresh random draws (own generators when seeded, else global state)
+        Sampling_Algorithms.seed(seed)
+        Event.clear_pools()  # Drop events recycled by a previous simulation
+
+        self.visitor_initial_rating = visitor_initial_rating  # Rating every arriving visitor starts with
 
         # Initialize all facilities
         self.reception = Reception(num_clerks=3)
@@ -53,12 +61,29 @@ class Simulation:
             self.salad_Restaurant
         ]
 
-        # Event queue (priority queue based on event time)
+        # Facility bitmasks for choose_facility (bit i = self.facilities[i])
+        self._facility_by_bit = {}
+        for i, facility in enumerate(self.facilities):
+            facility.mask_bit = 1 << i
+            self._facility_by_bit[facility.mask_bit] = facility
+        self._all_facilities_mask = (1 << len(self.facilities)) - 1
+        self._no_age_limit_mask = self._facility_mask(lambda f: f.age_limit == 0)
+        self._high_adrenalin_mask = self._facility_mask(lambda f: f.adrenalin_level >= 3)
+        self._adult_mask = self._facility_mask(lambda f: f.age_limit >= 12)
+        self._not_kids_pool_mask = self._facility_mask(lambda f: f.name != "Kids Pool")
+        self._age_limit_bits = tuple((f.age_limit, f.mask_bit) for f in self.facilities)
+        self._age_allowed_masks = {}  # min_age -> bitmask of facilities allowed at that age
+
+        # Event queue (priority queue of (time, seq, event) entries)
         self.event_queue = []
+        self._cancelled_abandon_count = 0  # Cancelled events still in the heap
 
-        # Simulation clock
-        self.clock = start_date
-        self.end_time = self.clock + timedelta(hours=10)
+        # Simulation clock: minutes since midnight of start_date (plain numbers,
+        # see clock_to_datetime() for reporting)
+        self.start_date = start_date
+        self.start_midnight = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.clock = (start_date - self.start_midnight).total_seconds() / 60
+        self.end_time = self.clock + 10 * 60
 
         # Reception queue (separate from facility queues)
         self.queue_reception = QueueServer()
@@ -69,25 +94,30 @@ class Simulation:
             facility.queue_regular.set_active_hours("09:00", "19:00")
             facility.queue_express.set_active_hours("09:00", "19:00")
 
+        # Every queue whose daily statistics are closed by EndOfDayEvent
+        self.stat_queues = [self.queue_reception]
+        for facility in self.facilities:
+            self.stat_queues += [facility.queue_regular, facility.queue_express]
+        self.stat_queues += [restaurant.queue for restaurant in self.restaurants]
+
         # Simulation statistics
         self.total_people_arrived = 0      # Total number of people who arrived (counting heads)
         self.total_entities_arrived = 0    # # Total number of entities who arrived (Family / Teen / Single)
         self.total_people_completed = 0    # Total number of people who completed
-        self.total_entities_completed = 0  # Total number of entities who completed
         self.total_people_entered = 0 # Total number of people who enterd the park (counting heads)
         self.total_entities_entered = 0 # Total number of entities who enterd the park
 
 
         self.total_revenue = 0
-        self.ratings = []
+        self._ratings = np.empty(1024)  # Final ratings (grown on demand, see ratings)
+        self._ratings_count = 0
         self.visitors_completed = []       # List of visitors who completed their visit (Family / Teen / Single)
+        self._completed_visitors = set()   # Same visitors, for O(1) membership checks
 
 
         # Schedule initial arrival events
         self._schedule_initial_arrivals()
 
-   #     self.reception_queue_history = [] # Queue history saving list
-
 
     def _schedule_initial_arrivals(self):
         """
@@ -95,13 +125,44 @@ class Simulation:
         Families start at 09:00, Teens at 10:00, Singles at 09:00.
         """
 
-        self.add_event(FamilyArrivalEvent(self.clock))  # Start at 09:00
-        self.add_event(TeensGroupArrivalEvent(self.clock + timedelta(hours=1)))  # Start at 10:00
-        self.add_event(SingleGroupArrivalEvent(self.clock))  # Start at 09:00
+        self.add_event(ArrivalEvent(self.clock, FAMILY_ARRIVALS))  # Start at 09:00
+        self.add_event(ArrivalEvent(self.clock + 60, TEENS_ARRIVALS))  # Start at 10:00
+        self.add_event(ArrivalEvent(self.clock, SINGLE_ARRIVALS))  # Start at 09:00
+
+    def clock_to_datetime(self, minutes):
+        """Convert simulation time (minutes) to a datetime for reporting."""
+        return self.start_midnight + timedelta(minutes=minutes)
 
     def add_event(self, event):
-        """Add event to priority queue (ordered by event time)."""
-        heapq.heappush(self.event_queue, event)
+        """
+        Add event to priority queue (ordered by event time).
+        Entries are (time, seq, event) tuples so heapq compares them in C
+        without calling Event.__lt__; seq is unique, so events never tie.
+        A pure-Python calendar (bucket) queue was measured slower than heapq
+        at this heap size, so the binary heap is kept.
+        A sorted static tail (bisect) is no help either: only the first
+        arrivals and the 19:00 EndOfDayEvent are known in advance, and almost
+        no pushes land after the current latest event.
+        """
+        heapq.heappush(self.event_queue, (event.time, event.seq, event))
+
+    def _admit_to_reception(self, visitor, now):
+        """
+        Send arriving visitor to reception.
+        Service starts immediately only if a clerk is free and nobody is waiting;
+        otherwise visitor joins the reception queue.
+        """
+        reception = self.reception
+        queue_reception = self.queue_reception
+        clerk = reception.get_available_clerk(now)
+        if clerk is not None and queue_reception.size() == 0:
+            # Clerk available and no queue - start service immediately
+            reception.assign_clerk(clerk)
+            service_minutes = reception.get_total_service_duration()
+            self.add_event(EndReceptionEvent(now + service_minutes, visitor, clerk))
+        else:
+            # All clerks busy or queue exists - join queue
+            queue_reception.add(visitor, now)
 
     def run(self):
         """
@@ -110,28 +171,40 @@ class Simulation:
         """
 
         # schedule first end-of-day (19:00 of current day)
-        first_day_end = self.clock.replace(hour=19, minute=0, second=0, microsecond=0)
+        first_day_end = self.clock - self.clock % MINUTES_PER_DAY + 19 * 60
         if first_day_end <= self.clock:
-            first_day_end += timedelta(days=1)
+            first_day_end += MINUTES_PER_DAY
         self.add_event(EndOfDayEvent(first_day_end))
 
         while self.event_queue and self.clock < self.end_time:
 
-            # (optional) save reception queue length history
-            try:
-                current_length = len(self.queue_reception)
-            except:
-                current_length = len(self.queue_reception.items) if hasattr(self.queue_reception, 'items') else 0
-        #    self.reception_queue_history.append(current_length)
+            # drop cancelled events in bulk once they dominate the heap
+            cancelled = self._cancelled_abandon_count
+            if cancelled > self.MIN_CANCELLED_EVENTS and cancelled * 2 > len(self.event_queue):
+                self._compact_event_queue()
+                if not self.event_queue:
+                    break
 
-            event = heapq.heappop(self.event_queue)
+            _, _, event = heapq.heappop(self.event_queue)
 
             # stop if next event is beyond simulation end time
             if event.time > self.end_time:
                 break
 
-            self.clock = event.time
-            event.handle(self)
+            # skip events cancelled after they were scheduled
+            if event.cancelled:
+                self._cancelled_abandon_count -= 1
+            else:
+                self.clock = event.time
+                event.handle(self)
+
+            # recycle handled or skipped event (only classes with a freelist)
+            pool = event._pool
+            if pool is not None and len(pool) < event.MAX_POOL_SIZE:
+                pool.append(event)
+
+        # recycled events hold visitors and facilities; don't keep this run alive through them
+        Event.clear_pools()
 
         # force everyone to leave only at FINAL end of simulation
         self.force_close_park()
@@ -151,35 +224,57 @@ class Simulation:
         Force all visitors still inside the park to leave at closing time (19:00).
         Counts ONLY visitors who entered the park and were not counted yet.
         """
-        completed_entities = set(self.visitors_completed)
+        completed_visitors = self._completed_visitors  # Kept up to date by _complete_visitor
+        # _complete_visitor leaves facilities and queues untouched, so they are iterated without copies
 
         for facility in self.facilities:
 
             # Visitors currently using the facility
-            for visitor in list(facility.users_in_service):
-                if visitor not in completed_entities:
+            for visitor in facility.users_in_service:
+                if visitor not in completed_visitors:
                     self._complete_visitor(visitor)
-                    completed_entities.add(visitor)
 
             # Visitors waiting in queues
             for queue in [facility.queue_regular, facility.queue_express]:
-                for visitor in list(queue):
-                    if visitor not in completed_entities:
+                for visitor in queue:
+                    if visitor not in completed_visitors:
                         self._complete_visitor(visitor)
-                        completed_entities.add(visitor)
 
 
-    def _complete_visitor(self, visitor):
-        package, price = Sampling_Algorithms.get_photo_purchase_decision(visitor.rating)
-        if package:
-            self.total_revenue += price
+    def _complete_visitor(self, visitor, buy_photos=True):
+        """
+        Record visitor (Family / Teen / Single) leaving the park.
+        Offers the photo package based on final rating, then updates
+        ratings and completion counters.
+        """
+        if buy_photos:
+            package, price = Sampling_Algorithms.get_photo_purchase_decision(visitor.rating)
+            if package:
+                self.total_revenue += price
 
-        self.ratings.append(visitor.rating)
+        self._record_rating(visitor.rating)
         self.visitors_completed.append(visitor)
-        self.total_entities_completed += 1
+        self._completed_visitors.add(visitor)
         self.total_people_completed += visitor.group_size
 
 
+    @property
+    def total_entities_completed(self):
+        """Total number of entities who completed (one per visitors_completed entry)."""
+        return len(self.visitors_completed)
+
+    @property
+    def ratings(self):
+        """Final ratings of completed visitors (NumPy view, in completion order)."""
+        return self._ratings[:self._ratings_count]
+
+    def _record_rating(self, rating):
+        """Store a final rating, doubling the preallocated array when full."""
+        if self._ratings_count == len(self._ratings):
+            self._ratings = np.concatenate((self._ratings, np.empty(len(self._ratings))))
+        self._ratings[self._ratings_count] = rating
+        self._ratings_count += 1
+
     def choose_facility(self, visitor, is_first_visit=False):
         """
         Choose next facility for visitor based on type and constraints.
@@ -195,258 +290,160 @@ class Simulation:
         Returns: Facility object or None if no eligible facilities
         """
 
-        # Check if visitor has visited all eligible facilities
-        if hasattr(visitor, 'visited_facilities'):
-            remaining_facilities = [f for f in self.facilities
-                                    if f not in visitor.visited_facilities
-                                    and f.age_limit <= visitor.get_min_age()]
+        unvisited = self._all_facilities_mask & ~visitor.visited_mask
+        age_allowed = visitor.age_allowed_mask
+        if age_allowed is None:
+            # Age never changes - look up the visitor's age mask once
+            age_allowed = self._age_allowed_mask(visitor.get_min_age())
+            visitor.age_allowed_mask = age_allowed
 
-            if not remaining_facilities:
-                return None  # All facilities visited
+        # Check if visitor has visited all eligible facilities
+        remaining = unvisited & age_allowed
+        if not remaining:
+            return None  # All facilities visited
 
         # ✅ CRITICAL FIX: Families on FIRST visit must go to age_limit=0 facilities ONLY
         if is_first_visit and isinstance(visitor, (Family, SubGroup)):
-            eligible = [f for f in self.facilities
-                        if f.age_limit == 0  # ONLY no-restriction facilities (Pipes River, Big Pipes)
-                        and f not in getattr(visitor, 'visited_facilities', [])]
+            eligible = unvisited & self._no_age_limit_mask  # ONLY no-restriction facilities (Pipes River, Big Pipes)
             if eligible:
-                return min(eligible, key=lambda f: f.get_total_waiting())
+                return self._least_waiting(eligible)
 
         # Teen groups: Adrenaline 3+, age appropriate
         if isinstance(visitor, TeenGroup):
-            eligible = [f for f in self.facilities
-                        if f.adrenalin_level >= 3  # High adrenaline only
-                        and f.age_limit <= visitor.get_min_age()
-                        and f not in getattr(visitor, 'visited_facilities', [])]
+            eligible = remaining & self._high_adrenalin_mask  # High adrenaline only
             if eligible:
-                return min(eligible, key=lambda f: f.get_total_waiting())
+                return self._least_waiting(eligible)
 
         # Single visitors: First visit prefers age_limit >= 12
         if isinstance(visitor, SingleVisitor):
             if is_first_visit:
-                eligible = [f for f in self.facilities
-                            if f.age_limit >= 12  # Prefer adult facilities
-                            and f not in getattr(visitor, 'visited_facilities', [])]
+                eligible = unvisited & self._adult_mask  # Prefer adult facilities
             else:
                 # After first visit: All except Kids Pool
-                eligible = [f for f in self.facilities
-                            if f.name != "Kids Pool"
-                            and f not in getattr(visitor, 'visited_facilities', [])]
+                eligible = unvisited & self._not_kids_pool_mask
 
             if eligible:
-                return min(eligible, key=lambda f: f.get_total_waiting())
+                return self._least_waiting(eligible)
 
         # Default case: Any age-appropriate facility
-        eligible = [f for f in self.facilities
-                    if f.age_limit <= visitor.get_min_age()
-                    and f not in getattr(visitor, 'visited_facilities', [])]
-        if eligible:
-            return min(eligible, key=lambda f: f.get_total_waiting())
+        return self._least_waiting(remaining)
+
+    def _facility_mask(self, predicate):
+        """Return bitmask of facilities matching predicate (bit = facility.mask_bit)."""
+        mask = 0
+        for facility in self.facilities:
+            if predicate(facility):
+                mask |= facility.mask_bit
+        return mask
+
+    def _age_allowed_mask(self, min_age):
+        """Return bitmask of facilities whose age limit allows min_age (cached per age)."""
+        mask = self._age_allowed_masks.get(min_age)
+        if mask is None:
+            mask = 0
+            for age_limit, bit in self._age_limit_bits:
+                if age_limit <= min_age:
+                    mask |= bit
+            self._age_allowed_masks[min_age] = mask
+        return mask
+
+    def _least_waiting(self, mask):
+        """
+        Return facility in mask with the fewest people waiting.
+        Ties go to the earliest facility in self.facilities.
+        """
+        best = None
+        best_waiting = 0
+        while mask:
+            bit = mask & -mask  # Lowest set bit
+            mask ^= bit
+            facility = self._facility_by_bit[bit]
+            waiting = facility.get_total_waiting()
+            if not waiting:
+                return facility  # Empty queues - nothing later can beat it
+            if best is None or waiting < best_waiting:
+                best = facility
+                best_waiting = waiting
+        return best
+
+    def _start_service(self, facility, visitor, end_time, instructor_idx=None):
+        """
+        Move visitor from facility queue into service until end_time.
+        Cancels the visitor's pending abandonment for this facility.
+        """
+        facility.add_user(visitor)
+        self.cancel_abandonment(visitor, facility)
+        self.add_event(EndFacilityEvent(end_time, visitor, facility, instructor_idx))
+
+    def _start_batch(self, facility, batch, end_time):
+        """
+        Move a whole slide batch into service until end_time.
+        The batch shares a single end event instead of one per visitor.
+        """
+        for visitor in batch:
+            facility.add_user(visitor)
+            self.cancel_abandonment(visitor, facility)
+        self.add_event(BatchEndFacilityEvent(end_time, batch, facility))
 
-        return None  # No eligible facilities
+    def schedule_instructor_break_end(self, facility, instructor_idx, end_time):
+        """Schedule the end of a snorkel instructor's post-tour break."""
+        self.add_event(InstructorBreakEndEvent(end_time, instructor_idx, facility))
 
-    def try_start_facility(self, facility, current_time):
+    def cancel_abandonment(self, visitor, facility):
         """
-        Attempt to start service at facility.
-        Each facility type has different entry logic:
-        - Pipes River: Pairing logic for odd groups
-        - Single Slide: Per-slide cooldown
-        - Big/Small Pipes: Exact capacity batching
-        - Wave/Kids Pool: Capacity-based entry
-        - Snorkel Tour: Instructor availability
+        Cancel visitor's pending AbandonmentEvent once it can no longer fire.
+        The event stays in the heap and is skipped when popped; run() rebuilds
+        the heap once cancelled events make up half of it.
         """
+        event = visitor.pending_abandonment
+        if event is None or event.facility is not facility:
+            return
+        if visitor in facility.queue_regular or visitor in facility.queue_express:
+            return  # Still queued here - abandonment may still happen
+
+        event.cancelled = True
+        visitor.pending_abandonment = None
+        self._cancelled_abandon_count += 1
+
+    def _compact_event_queue(self):
+        """Drop cancelled events from the heap and restore heap order."""
+        self.event_queue = [entry for entry in self.event_queue if not entry[2].cancelled]
+        heapq.heapify(self.event_queue)
+        self._cancelled_abandon_count = 0
 
-        # PIPES RIVER: Process entry with pairing logic
-        if isinstance(facility, Pipes_River):
-            entering = facility.process_entry(current_time)
-            for group in entering:
-                duration = facility.get_service_duration()
-                facility.users_in_service.append(group)
-                self.add_event(EndFacilityEvent(current_time + timedelta(minutes=duration), group, facility))
-
-        # SINGLE SLIDE: Check per-slide availability
-        elif isinstance(facility, Single_Slide):
-            while facility.queue_express or facility.queue_regular:
-                slide_idx = facility.get_available_slide(current_time)
-                if slide_idx is None:
-                    break  # All slides on cooldown
-
-                # Priority: Express > Regular
-                visitor = None
-                if facility.queue_express:
-                    visitor, _ = facility.queue_express.pop(current_time)
-                elif facility.queue_regular:
-                    visitor, _ = facility.queue_regular.pop(current_time)
-
-                if visitor:
-                    facility.record_entry(slide_idx, current_time)
-                    facility.users_in_service.append(visitor)
-                    duration = facility.get_service_duration()
-                    self.add_event(EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-
-        # BIG PIPES SLIDE: Batch exactly 8 people
-        elif isinstance(facility, Big_Pipes_Slide):
-            if facility.can_enter(current_time):
-                batch = facility.get_next_batch(current_time)  # ✅ FIXED: Pass current_time
-                if batch:
-                    for visitor in batch:
-                        facility.users_in_service.append(visitor)
-                    duration = facility.get_service_duration()
-                    for visitor in batch:
-                        self.add_event(EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-
-        # SMALL PIPES SLIDE: Batch exactly 3 people
-        elif isinstance(facility, Small_Pipes_Slide):
-            if facility.can_enter(current_time):
-                batch = facility.get_next_batch(current_time)  # ✅ FIXED: Pass current_time
-                if batch:
-                    for visitor in batch:
-                        facility.users_in_service.append(visitor)
-                    duration = facility.get_service_duration()
-                    for visitor in batch:
-                        self.add_event(EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-
-        # WAVE POOL: Capacity-based entry
-        elif isinstance(facility, Waves_Pool):
-            entered_anyone = True
-            while entered_anyone and (facility.queue_express or facility.queue_regular):
-                entered_anyone = False
-
-                # Try express queue first
-                if facility.queue_express:
-                    temp_queue = list(facility.queue_express)
-                    for i in range(len(temp_queue)):
-                        next_visitor = temp_queue[i]
-                        if facility.can_enter(current_time, next_visitor.group_size):
-                            if i == 0:
-                                visitor, _ = facility.queue_express.pop(current_time)
-                            else:
-                                facility.queue_express.remove(next_visitor, current_time)
-                                visitor = next_visitor
-
-                            facility.users_in_service.append(visitor)
-                            duration = facility.get_service_duration()
-                            self.add_event(
-                                EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-                            entered_anyone = True
-                            break
-
-                # Try regular queue if express didn't enter anyone
-                if not entered_anyone and facility.queue_regular:
-                    temp_queue = list(facility.queue_regular)
-                    for i in range(len(temp_queue)):
-                        next_visitor = temp_queue[i]
-                        if facility.can_enter(current_time, next_visitor.group_size):
-                            if i == 0:
-                                visitor, _ = facility.queue_regular.pop(current_time)
-                            else:
-                                facility.queue_regular.remove(next_visitor, current_time)
-                                visitor = next_visitor
-
-                            facility.users_in_service.append(visitor)
-                            duration = facility.get_service_duration()
-                            self.add_event(
-                                EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-                            entered_anyone = True
-                            break
-
-        # KIDS POOL: Capacity-based entry
-        elif isinstance(facility, Kids_Pool):
-            entered_anyone = True
-            while entered_anyone and (facility.queue_express or facility.queue_regular):
-                entered_anyone = False
-
-                # Try express queue first
-                if facility.queue_express:
-                    temp_queue = list(facility.queue_express)
-                    for i in range(len(temp_queue)):
-                        next_visitor = temp_queue[i]
-                        if facility.can_enter(current_time, next_visitor.group_size):
-                            if i == 0:
-                                visitor, _ = facility.queue_express.pop(current_time)
-                            else:
-                                facility.queue_express.remove(next_visitor, current_time)
-                                visitor = next_visitor
-
-                            facility.users_in_service.append(visitor)
-                            duration = facility.get_service_duration()
-                            self.add_event(
-                                EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-                            entered_anyone = True
-                            break
-
-                # Try regular queue if express didn't enter anyone
-                if not entered_anyone and facility.queue_regular:
-                    temp_queue = list(facility.queue_regular)
-                    for i in range(len(temp_queue)):
-                        next_visitor = temp_queue[i]
-                        if facility.can_enter(current_time, next_visitor.group_size):
-                            if i == 0:
-                                visitor, _ = facility.queue_regular.pop(current_time)
-                            else:
-                                facility.queue_regular.remove(next_visitor, current_time)
-                                visitor = next_visitor
-
-                            facility.users_in_service.append(visitor)
-                            duration = facility.get_service_duration()
-                            self.add_event(
-                                EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility))
-                            entered_anyone = True
-                            break
-
-        # SNORKEL TOUR: Instructor-based tours
-        elif isinstance(facility, Snorkel_Tour):
-            instructor_idx = facility.get_available_instructor(current_time)
-            if instructor_idx is not None and (facility.queue_express or facility.queue_regular):
-                tour_group = []
-                tour_size = 0
-
-                # Fill tour up to capacity (30 people)
-                while tour_size < facility.tour_capacity and (facility.queue_express or facility.queue_regular):
-                    visitor = None
-
-                    # Priority: Express > Regular
-                    if facility.queue_express:
-                        next_visitor = facility.queue_express[0]
-                        if tour_size + next_visitor.group_size <= facility.tour_capacity:
-                            visitor, _ = facility.queue_express.pop(current_time)
-                        else:
-                            break  # Group too large
-                    elif facility.queue_regular:
-                        next_visitor = facility.queue_regular[0]
-                        if tour_size + next_visitor.group_size <= facility.tour_capacity:
-                            visitor, _ = facility.queue_regular.pop(current_time)
-                        else:
-                            break
-
-                    if visitor:
-                        tour_group.append(visitor)
-                        tour_size += visitor.group_size
-                    else:
-                        break
-
-                # Start tour if we have at least one visitor
-                if tour_group:
-                    duration = facility.get_service_duration()
-                    facility.start_tour(instructor_idx, current_time, duration)
-                    for visitor in tour_group:
-                        facility.users_in_service.append(visitor)
-                        self.add_event(EndFacilityEvent(current_time + timedelta(minutes=duration), visitor, facility,
-                                                        instructor_idx))
     def welch_cumulative_avg(self, data):
-        data = np.array(data, dtype=float)
+        data = np.asarray(data, dtype=float)  # No copy for float arrays
         if len(data) == 0:
             return data
-        return np.cumsum(data) / (np.arange(len(data)) + 1)
+        out = np.cumsum(data)
+        out /= np.arange(1, len(data) + 1)  # In place - no extra result array
+        return out
 
-    def plot_heating_time_days(self, data, title):
+    def plot_heating_time_days(self, data, title, save_path=None):
+        """
+        Plot daily values against their Welch cumulative average.
+        Shows the plot interactively, or writes it to save_path without
+        loading pyplot or a GUI backend (for headless batch runs).
+        matplotlib is imported here so simulation runs never pay for it.
+        """
         welch_line = self.welch_cumulative_avg(data)
 
-        plt.figure(figsize=(10, 6))
-        plt.plot(range(1, len(data) + 1), data, label="Daily values")
-        plt.plot(range(1, len(data) + 1), welch_line, "--", label="Welch (cumulative avg)")
-        plt.xlabel("Days")
-        plt.ylabel("Value")
-        plt.title(title)
-        plt.legend()
-        plt.show()
+        if save_path is None:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10, 6))
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(10, 6))
+
+        ax = fig.add_subplot()
+        ax.plot(range(1, len(data) + 1), data, label="Daily values")
+        ax.plot(range(1, len(data) + 1), welch_line, "--", label="Welch (cumulative avg)")
+        ax.set_xlabel("Days")
+        ax.set_ylabel("Value")
+        ax.set_title(title)
+        ax.legend()
+
+        if save_path is None:
+            plt.show()
+        else:
+            fig.savefig(save_path)
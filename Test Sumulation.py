@@ -63,11 +63,11 @@ def main():
     print("-" * 30)
 
     # Rating statistics
-    if sim.ratings:
-        avg_rating = sum(sim.ratings) / len(sim.ratings)
-        print(f"דירוג ממוצע: {avg_rating:.2f}")
-        print(f"דירוג מינימלי: {min(sim.ratings):.2f}")
-        print(f"דירוג מקסימלי: {max(sim.ratings):.2f}")
+    ratings = sim.ratings
+    if len(ratings):
+        print(f"דירוג ממוצע: {ratings.mean():.2f}")
+        print(f"דירוג מינימלי: {ratings.min():.2f}")
+        print(f"דירוג מקסימלי: {ratings.max():.2f}")
 
     print()
     print("סטטיסטיקות תורים - מתקנים:")
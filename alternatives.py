@@ -1,6 +1,6 @@
-import pandas as pd
+import os
 import numpy as np
-import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from Simulation import Simulation
 
@@ -9,17 +9,15 @@ from Simulation import Simulation
 # =============================================================================
 NUM_DAYS = 30
 START_DATE = datetime(2025, 1, 1, 9, 0, 0)
+PANDAS_PRECISION = 6  # pandas display.precision: max decimals in printed tables
 
 
 # =============================================================================
 # Alternative 1: Baseline (Current State)
 # =============================================================================
 def run_baseline(day_num):
-    random.seed(1000 + day_num)
-    np.random.seed(1000 + day_num)
-
     sim_date = START_DATE + timedelta(days=day_num - 1)
-    sim = Simulation(sim_date)
+    sim = Simulation(sim_date, seed=1000 + day_num)
     sim.run()
 
     return sim
@@ -29,31 +27,19 @@ def run_baseline(day_num):
 # Alternative 2: Website + Benefits + Wave Pool (220k)
 # =============================================================================
 def run_alternative2(day_num):
-    random.seed(2000 + day_num)
-    np.random.seed(2000 + day_num)
-
     sim_date = START_DATE + timedelta(days=day_num - 1)
-    sim = Simulation(sim_date)
-
-    # Change 1: Website - only wristband (no ticket)
-    sim.reception.get_total_service_duration = lambda: sim.reception.get_wristband_duration()
 
     # Change 2: Customer benefits - rating 11
-    import entities
-    original_init = entities.Visitor.__init__
-
-    def new_init(self, arrival_time):
-        original_init(self, arrival_time)
-        self.rating = 11.0
+    sim = Simulation(sim_date, visitor_initial_rating=11.0, seed=2000 + day_num)
 
-    entities.Visitor.__init__ = new_init
+    # Change 1: Website - only wristband (no ticket)
+    sim.reception.get_total_service_duration = lambda: sim.reception.get_wristband_duration()
 
     # Change 3: Wave pool capacity 120
     sim.waves_Pool.capacity = 120
 
     sim.run()
 
-    entities.Visitor.__init__ = original_init
     return sim
 
 
@@ -61,11 +47,8 @@ def run_alternative2(day_num):
 # Alternative 3: Big Tubes 10 + Wave Pool (220k)
 # =============================================================================
 def run_alternative3(day_num):
-    random.seed(3000 + day_num)
-    np.random.seed(3000 + day_num)
-
     sim_date = START_DATE + timedelta(days=day_num - 1)
-    sim = Simulation(sim_date)
+    sim = Simulation(sim_date, seed=3000 + day_num)
 
     # Change 1: Big pipes - 10 capacity
     sim.big_Pipes_Slide.capacity = 10
@@ -82,121 +65,135 @@ def run_alternative3(day_num):
 # =============================================================================
 # Calculate Metrics
 # =============================================================================
-def calculate_metrics(sim):
-    # Metric 1: Average waiting time (facilities + restaurants)
-    all_wait_times = []
-
-    # Reception queue
-    if sim.queue_reception.daily_avg_waiting_times:
-        all_wait_times.append(sim.queue_reception.daily_avg_waiting_times[0])
-
-    # Facility queues
+def _iter_metric_queues(sim):
+    """Yield the queues whose first-day waiting time enters the wait metric."""
+    yield sim.queue_reception  # Reception queue
     for facility in sim.facilities:
-        if facility.queue_regular.daily_avg_waiting_times:
-            all_wait_times.append(facility.queue_regular.daily_avg_waiting_times[0])
-
-    # Restaurant queues ✅ NEW!
+        yield facility.queue_regular  # Facility queues
     for restaurant in sim.restaurants:
-        if restaurant.queue.daily_avg_waiting_times:
-            all_wait_times.append(restaurant.queue.daily_avg_waiting_times[0])
+        yield restaurant.queue  # Restaurant queues ✅ NEW!
 
-    avg_wait = np.mean(all_wait_times) if all_wait_times else 0
+
+def calculate_metrics(sim):
+    # Metric 1: Average waiting time (reception + facilities + restaurants)
+    all_wait_times = np.fromiter((q.daily_avg_waiting_times[0] for q in _iter_metric_queues(sim)
+                                  if q.daily_avg_waiting_times), dtype=np.float64)
+
+    avg_wait = all_wait_times.mean() if all_wait_times.size else 0
 
     # Metric 2: Average rating
-    avg_rating = np.mean(sim.ratings) if sim.ratings else 0
+    avg_rating = np.mean(sim.ratings) if len(sim.ratings) else 0
 
     return avg_wait, avg_rating
 
 
 # =============================================================================
-# Run Simulations
+# Results Table
 # =============================================================================
-print("Running simulations...")
-
-baseline_results = []
-alt2_results = []
-alt3_results = []
-
-for day in range(1, NUM_DAYS + 1):
-    print(f"Day {day}/{NUM_DAYS}...", end='\r')
-
-    # Alternative 1
-    sim1 = run_baseline(day)
-    wait1, rating1 = calculate_metrics(sim1)
-    baseline_results.append({'wait': wait1, 'rating': rating1})
+def _decimals(value):
+    """Number of decimal places needed to print a float, at most PANDAS_PRECISION."""
+    text = repr(round(float(value), PANDAS_PRECISION))
+    return min(len(text.split('.')[1]), PANDAS_PRECISION) if '.' in text and 'e' not in text else 0
+
+
+def format_table(rows):
+    """
+    Format a list of row dicts as a right-aligned text table.
+    Float columns share one number of decimals (at least one, at most
+    PANDAS_PRECISION), matching pandas' DataFrame.to_string(index=False) layout
+    with the default display precision.
+    """
+    columns = list(rows[0])
+    formatted = []
+    for column in columns:
+        values = [row[column] for row in rows]
+        floats = [v for v in values if isinstance(v, float)]
+        decimals = max([1] + [_decimals(v) for v in floats])
+        cells = [f"{v:.{decimals}f}" if isinstance(v, float) else str(v) for v in values]
+        width = max(len(column), *(len(cell) for cell in cells))
+        formatted.append([column.rjust(width)] + [cell.rjust(width) for cell in cells])
+
+    return "\n".join("  ".join(line) for line in zip(*formatted))
 
-    # Alternative 2
-    sim2 = run_alternative2(day)
-    wait2, rating2 = calculate_metrics(sim2)
-    alt2_results.append({'wait': wait2, 'rating': rating2})
-
-    # Alternative 3
-    sim3 = run_alternative3(day)
-    wait3, rating3 = calculate_metrics(sim3)
-    alt3_results.append({'wait': wait3, 'rating': rating3})
-
-print("Completed!                    ")
 
 # =============================================================================
-# Create Table
+# Run Simulations
 # =============================================================================
-data = []
+ALTERNATIVES = (run_baseline, run_alternative2, run_alternative3)
+
+
+def run_day_metrics(task):
+    """
+    Worker for one (alternative index, day) run.
+    Each run reseeds from its day number, so runs are independent and only
+    the two metric floats are sent back to the parent process.
+    """
+    alt_idx, day = task
+    sim = ALTERNATIVES[alt_idx](day)
+    return calculate_metrics(sim)
+
+
+def main():
+    print("Running simulations...")
+
+    tasks = [(alt_idx, day) for alt_idx in range(len(ALTERNATIVES)) for day in range(1, NUM_DAYS + 1)]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        metrics = list(executor.map(run_day_metrics, tasks))
+
+    # Results come back in task order: NUM_DAYS runs per alternative, columns (wait, rating)
+    results = np.array(metrics, dtype=float).reshape(len(ALTERNATIVES), NUM_DAYS, 2)
+    baseline_results, alt2_results, alt3_results = results
+
+    print("Completed!                    ")
+
+    # =============================================================================
+    # Create Table
+    # =============================================================================
+    data = []
+
+    for i in range(NUM_DAYS):
+        data.append({
+            'Run Number': i + 1,
+            'Avg Wait Time - Alt 1': round(baseline_results[i, 0], 2),
+            'Avg Rating - Alt 1': round(baseline_results[i, 1], 2),
+            'Avg Wait Time - Alt 2': round(alt2_results[i, 0], 2),
+            'Avg Rating - Alt 2': round(alt2_results[i, 1], 2),
+            'Avg Wait Time - Alt 3': round(alt3_results[i, 0], 2),
+            'Avg Rating - Alt 3': round(alt3_results[i, 1], 2),
+        })
+
+    # Calculate means and standard deviations of (wait, rating) per alternative
+    baseline_mean, alt2_mean, alt3_mean = results.mean(axis=1)
+    baseline_std, alt2_std, alt3_std = results.std(axis=1, ddof=1)
+
+    # Add summary rows
+    data.append({
+        'Run Number': 'Mean',
+        'Avg Wait Time - Alt 1': round(baseline_mean[0], 3),
+        'Avg Rating - Alt 1': round(baseline_mean[1], 2),
+        'Avg Wait Time - Alt 2': round(alt2_mean[0], 3),
+        'Avg Rating - Alt 2': round(alt2_mean[1], 2),
+        'Avg Wait Time - Alt 3': round(alt3_mean[0], 3),
+        'Avg Rating - Alt 3': round(alt3_mean[1], 2),
+    })
 
-for i in range(NUM_DAYS):
     data.append({
-        'Run Number': i + 1,
-        'Avg Wait Time - Alt 1': round(baseline_results[i]['wait'], 2),
-        'Avg Rating - Alt 1': round(baseline_results[i]['rating'], 2),
-        'Avg Wait Time - Alt 2': round(alt2_results[i]['wait'], 2),
-        'Avg Rating - Alt 2': round(alt2_results[i]['rating'], 2),
-        'Avg Wait Time - Alt 3': round(alt3_results[i]['wait'], 2),
-        'Avg Rating - Alt 3': round(alt3_results[i]['rating'], 2),
+        'Run Number': 'Std Dev',
+        'Avg Wait Time - Alt 1': round(baseline_std[0], 3),
+        'Avg Rating - Alt 1': round(baseline_std[1], 3),
+        'Avg Wait Time - Alt 2': round(alt2_std[0], 3),
+        'Avg Rating - Alt 2': round(alt2_std[1], 3),
+        'Avg Wait Time - Alt 3': round(alt3_std[0], 3),
+        'Avg Rating - Alt 3': round(alt3_std[1], 3),
     })
 
-# Calculate means
-baseline_wait_mean = np.mean([r['wait'] for r in baseline_results])
-baseline_rating_mean = np.mean([r['rating'] for r in baseline_results])
-alt2_wait_mean = np.mean([r['wait'] for r in alt2_results])
-alt2_rating_mean = np.mean([r['rating'] for r in alt2_results])
-alt3_wait_mean = np.mean([r['wait'] for r in alt3_results])
-alt3_rating_mean = np.mean([r['rating'] for r in alt3_results])
-
-# Calculate standard deviations
-baseline_wait_std = np.std([r['wait'] for r in baseline_results], ddof=1)
-baseline_rating_std = np.std([r['rating'] for r in baseline_results], ddof=1)
-alt2_wait_std = np.std([r['wait'] for r in alt2_results], ddof=1)
-alt2_rating_std = np.std([r['rating'] for r in alt2_results], ddof=1)
-alt3_wait_std = np.std([r['wait'] for r in alt3_results], ddof=1)
-alt3_rating_std = np.std([r['rating'] for r in alt3_results], ddof=1)
-
-# Add summary rows
-data.append({
-    'Run Number': 'Mean',
-    'Avg Wait Time - Alt 1': round(baseline_wait_mean, 3),
-    'Avg Rating - Alt 1': round(baseline_rating_mean, 2),
-    'Avg Wait Time - Alt 2': round(alt2_wait_mean, 3),
-    'Avg Rating - Alt 2': round(alt2_rating_mean, 2),
-    'Avg Wait Time - Alt 3': round(alt3_wait_mean, 3),
-    'Avg Rating - Alt 3': round(alt3_rating_mean, 2),
-})
-
-data.append({
-    'Run Number': 'Std Dev',
-    'Avg Wait Time - Alt 1': round(baseline_wait_std, 3),
-    'Avg Rating - Alt 1': round(baseline_rating_std, 3),
-    'Avg Wait Time - Alt 2': round(alt2_wait_std, 3),
-    'Avg Rating - Alt 2': round(alt2_rating_std, 3),
-    'Avg Wait Time - Alt 3': round(alt3_wait_std, 3),
-    'Avg Rating - Alt 3': round(alt3_rating_std, 3),
-})
-
-# Create DataFrame
-df = pd.DataFrame(data)
-
-# Print table
-print("\n" + "=" * 100)
-print(f"Simulation Results - {NUM_DAYS} Days")
-print("=" * 100)
-print(df.to_string(index=False))
-print("=" * 100)
+    # Print table
+    print("\n" + "=" * 100)
+    print(f"Simulation Results - {NUM_DAYS} Days")
+    print("=" * 100)
+    print(format_table(data))
+    print("=" * 100)
+
 
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import itertools
+
 from sampling_algorithms import Sampling_Algorithms
 
 
@@ -7,15 +9,54 @@ class Visitor:
     Handles rating system, express pass, and queue management.
     """
 
+    # No per-visitor __dict__; subclasses add their own fields
+    __slots__ = ('id', 'arrival_time', 'rating', 'has_express_pass', 'time_entered_queue',
+                 'current_facility', 'departure_time', 'departure_minutes', 'pending_abandonment',
+                 'visited_mask', 'age_allowed_mask', 'group_size', 'min_age', 'visited_facilities',
+                 'is_shared_tube', 'tube_partner')
+
+    _id_counter = itertools.count()  # Dense visitor ids (0, 1, 2, ...) in creation order
 
-    def __init__(self, arrival_time):
-        self.id = id(self)  # Unique identifier for the visitor
-        self.arrival_time = arrival_time  # DateTime when visitor arrived at park
-        self.rating = 10.0
+    def __init__(self, arrival_time, initial_rating=10.0):
+        self.id = next(Visitor._id_counter)  # Unique identifier for the visitor
+        self.arrival_time = arrival_time  # Simulation time (minutes) when visitor arrived at park
+        self.rating = initial_rating
         self.has_express_pass = False  # Whether visitor purchased express pass
         self.time_entered_queue = None  # Track when visitor entered current queue
         self.current_facility = None  # Current facility visitor is queuing for
         self.departure_time = None  # Scheduled departure time
+        self.departure_minutes = None  # Scheduled departure in simulation minutes
+        self.pending_abandonment = None  # AbandonmentEvent scheduled for current queue
+        self.visited_mask = 0  # Bitmask of visited facilities (facility.mask_bit)
+        self.age_allowed_mask = None  # Bitmask of age-appropriate facilities (built on first use)
+        self.is_shared_tube = False  # Set by Pipes River when paired into shared tubes
+        self.tube_partner = None  # Group sharing the tube(s), if any
+
+    def set_departure_time(self, departure_time):
+        """
+        Set scheduled departure hour (e.g. 17.5 = 17:30).
+        Also precomputes the matching simulation time on the arrival day, so
+        departure checks are a single number comparison.
+        """
+        self.departure_time = departure_time
+        dep_hour = int(departure_time)
+        dep_min = int((departure_time % 1) * 60)
+        arrival_midnight = self.arrival_time - self.arrival_time % (24 * 60)
+        self.departure_minutes = arrival_midnight + dep_hour * 60 + dep_min
+
+    def compute_entry_revenue(self):
+        """
+        Return entry revenue paid at reception.
+        Default: 150₪ per person, plus 50₪ per person for express pass.
+        """
+        revenue = self.group_size * 150
+        if self.has_express_pass:
+            revenue += self.group_size * 50
+        return revenue
+
+    def leave_park(self, simulation):
+        """Leave the park and record the visit as completed."""
+        simulation._complete_visitor(self)
 
     def update_rating_positive(self, group_size, adrenaline_level):
         """
@@ -71,8 +112,11 @@ class Family(Visitor):
     Can split into subgroups based on children's ages.
     """
 
-    def __init__(self, arrival_time):
-        super().__init__(arrival_time)
+    __slots__ = ('num_kids', 'total_size', 'kids_ages', 'is_split', 'split_decided',
+                 'subgroups', 'active_subgroups_count')
+
+    def __init__(self, arrival_time, initial_rating=10.0):
+        super().__init__(arrival_time, initial_rating)
 
         # Generate family composition
         self.num_kids = Sampling_Algorithms.get_number_kids()  # Discrete Uniform[1,5]
@@ -86,15 +130,16 @@ class Family(Visitor):
             self.kids_ages.append(age)
 
         # Family departure time: f(x) = 2/9(x-16), 16≤x≤19
-        self.departure_time = Sampling_Algorithms.get_family_departure_time()
+        self.set_departure_time(Sampling_Algorithms.get_family_departure_time())
 
         # Splitting management
         self.is_split = False  # Whether family has split into subgroups
+        self.split_decided = False  # Split is decided once, after the first ride
         self.subgroups = []  # List of SubGroup objects if split
         self.active_subgroups_count = 1  # Number of active subgroups (for tracking completion)
 
         # Track which facilities have been visited
-        self.visited_facilities = []
+        self.visited_facilities = set()
 
         # 25% chance to buy express pass on entry
         if Sampling_Algorithms.should_buy_express_on_entry():
@@ -104,6 +149,20 @@ class Family(Visitor):
         """Families abandon queue after 15 minutes."""
         return 15
 
+    def compute_entry_revenue(self):
+        """Family: 2 adults @ 150₪ + kids @ 75₪, express pass 50₪ per person."""
+        adults = 2
+        kids = self.num_kids
+        revenue = adults * 150 + kids * 75
+        if self.has_express_pass:
+            revenue += (adults + kids) * 50
+        return revenue
+
+    def leave_park(self, simulation):
+        """Whole family leaves together - no subgroups left in the park."""
+        self.active_subgroups_count = 0
+        simulation._complete_visitor(self)
+
     def check_and_split(self):
         """
         Determine if family splits into subgroups (60% probability).
@@ -112,8 +171,14 @@ class Family(Visitor):
         - Kids 12+ can supervise younger siblings
         - Split into 2 or 3 groups (equal probability)
 
+        The decision is made once; later calls return the same result.
+
         Returns: List containing either [self] or list of SubGroup objects
         """
+        if self.split_decided:
+            return self.subgroups if self.is_split else [self]
+        self.split_decided = True
+
         # 40% chance family stays together
         if not Sampling_Algorithms.should_family_split():
             return [self]
@@ -121,10 +186,17 @@ class Family(Visitor):
         self.is_split = True
         num_groups = Sampling_Algorithms.get_num_split_groups()  # 2 or 3 groups
 
-        # Categorize kids by age
-        kids_under_8 = [age for age in self.kids_ages if age < 8]
-        kids_8_to_12 = [age for age in self.kids_ages if 8 <= age < 12]
-        kids_over_12 = [age for age in self.kids_ages if age >= 12]
+        # Categorize kids by age (one pass)
+        kids_under_8 = []
+        kids_8_to_12 = []
+        kids_over_12 = []
+        for age in self.kids_ages:
+            if age < 8:
+                kids_under_8.append(age)
+            elif age < 12:
+                kids_8_to_12.append(age)
+            else:
+                kids_over_12.append(age)
 
         subgroups = []
 
@@ -182,6 +254,8 @@ class SubGroup(Visitor):
     Maintains reference to parent family for coordination.
     """
 
+    __slots__ = ('parent_family',)
+
     def __init__(self, parent_family, size, min_age, has_express_pass):
         super().__init__(parent_family.arrival_time)
         self.parent_family = parent_family  # Reference to original Family object
@@ -190,14 +264,25 @@ class SubGroup(Visitor):
         self.has_express_pass = has_express_pass
         self.rating = parent_family.rating  # Share rating with parent family
         self.departure_time = parent_family.departure_time  # Share departure time
+        self.departure_minutes = parent_family.departure_minutes
 
         # Track which facilities have been visited
-        self.visited_facilities = []
+        self.visited_facilities = set()
 
     def get_abandonment_threshold(self):
         """SubGroups abandon queue after 15 minutes (same as families)."""
         return 15
 
+    def leave_park(self, simulation):
+        """
+        Subgroup leaves the park.
+        The family is completed only once its last subgroup is out.
+        """
+        family = self.parent_family
+        family.active_subgroups_count -= 1
+        if family.active_subgroups_count == 0:
+            simulation._complete_visitor(family)
+
     def get_min_age(self):
         """Return minimum age in this subgroup."""
         return self.min_age
@@ -210,8 +295,10 @@ class TeenGroup(Visitor):
     Can purchase express pass after abandoning queue.
     """
 
-    def __init__(self, arrival_time):
-        super().__init__(arrival_time)
+    __slots__ = ('abandoned_facilities', 'abandon_count')
+
+    def __init__(self, arrival_time, initial_rating=10.0):
+        super().__init__(arrival_time, initial_rating)
 
         # Group composition
         self.group_size = Sampling_Algorithms.get_teen_group_size()  # 2-6 people
@@ -222,10 +309,10 @@ class TeenGroup(Visitor):
         self.abandon_count = 0  # Number of times they've abandoned queues
 
         # Track which facilities have been visited
-        self.visited_facilities = []
+        self.visited_facilities = set()
 
         # Teens leave at park closing (19:00)
-        self.departure_time = 19.0
+        self.set_departure_time(19.0)
 
         # 25% chance to buy express pass on entry
         if Sampling_Algorithms.should_buy_express_on_entry():
@@ -265,17 +352,19 @@ class SingleVisitor(Visitor):
     Prefer facilities with age restriction 12+.
     """
 
-    def __init__(self, arrival_time):
-        super().__init__(arrival_time)
+    __slots__ = ()
+
+    def __init__(self, arrival_time, initial_rating=10.0):
+        super().__init__(arrival_time, initial_rating)
 
         self.group_size = 1
         self.min_age = Sampling_Algorithms.sample_uniform(18, 70)  # Random adult age
 
         # Track which facilities have been visited
-        self.visited_facilities = []
+        self.visited_facilities = set()
 
         # Single visitors leave at park closing (19:00)
-        self.departure_time = 19.0
+        self.set_departure_time(19.0)
 
         # 25% chance to buy express pass on entry
         if Sampling_Algorithms.should_buy_express_on_entry():
@@ -291,16 +380,16 @@ class SingleVisitor(Visitor):
 
 
 # Factory functions for creating visitors
-def create_family(arrival_time):
+def create_family(arrival_time, initial_rating=10.0):
     """Create and return a new Family object."""
-    return Family(arrival_time)
+    return Family(arrival_time, initial_rating)
 
 
-def create_teen_group(arrival_time):
+def create_teen_group(arrival_time, initial_rating=10.0):
     """Create and return a new TeenGroup object."""
-    return TeenGroup(arrival_time)
+    return TeenGroup(arrival_time, initial_rating)
 
 
-def create_single_visitor(arrival_time):
+def create_single_visitor(arrival_time, initial_rating=10.0):
     """Create and return a new SingleVisitor object."""
-    return SingleVisitor(arrival_time)
\ No newline at end of file
+    return SingleVisitor(arrival_time, initial_rating)
\ No newline at end of file
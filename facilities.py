@@ -1,9 +1,21 @@
-from collections import deque
-import math
+from itertools import islice
 
 from Queue import QueueServer
 from sampling_algorithms import Sampling_Algorithms
 
+MINUTES_PER_DAY = 24 * 60  # Simulation time is minutes since midnight of the first day
+
+# Snorkel instructor schedule (minutes since midnight)
+TOUR_CUTOFF_MIN = 12 * 60 + 20  # 12:20 - no new tours, so none runs into lunch
+LUNCH_START_MIN = 13 * 60  # 13:00 - mandatory lunch break starts
+LUNCH_END_MIN = 14 * 60  # 14:00 - lunch ends, tours may start again
+
+# Snorkel instructor status (exactly one holds at a time)
+INSTRUCTOR_AVAILABLE = 0  # Can start new tour
+INSTRUCTOR_ON_TOUR = 1  # Currently leading tour
+INSTRUCTOR_ON_BREAK = 2  # On 30-min break after tour
+INSTRUCTOR_ON_LUNCH = 3  # On lunch break (13:00-14:00)
+
 
 class Facility:
     """
@@ -21,12 +33,26 @@ class Facility:
 
         self.queue_regular = QueueServer()  # Regular queue
         self.queue_express = QueueServer()  # Express pass queue (priority)
-        self.users_in_service = []  # List of visitors currently using facility
+        self.users_in_service = set()  # Visitors currently using facility
+        self.people_in_service = 0  # Total group size of users_in_service
+        self.mask_bit = 0  # Bit for this facility in visitor masks (set by Simulation)
 
     def get_total_waiting(self):
-        """Return total number of people waiting in both queues."""
+        """Return total number of people waiting in both queues (O(1) - queues keep live counts)."""
         return self.queue_regular.size() + self.queue_express.size()
 
+    def add_user(self, visitor):
+        """Put visitor into service, if not already in it (keeps people_in_service up to date)."""
+        if visitor not in self.users_in_service:
+            self.users_in_service.add(visitor)
+            self.people_in_service += visitor.group_size
+
+    def remove_user(self, visitor):
+        """Take visitor out of service, if still in it."""
+        if visitor in self.users_in_service:
+            self.users_in_service.remove(visitor)
+            self.people_in_service -= visitor.group_size
+
     def enter_queue(self, visitor, current_time):
         """
         Add visitor to appropriate queue based on express pass status.
@@ -37,6 +63,113 @@ class Facility:
         else:
             self.queue_regular.add(visitor, current_time)
 
+    def try_start(self, simulation, current_time):
+        """
+        Attempt to start service for waiting visitors.
+        Called by events whenever a facility may admit someone.
+        Each facility type implements its own entry logic (default: nothing):
+        - Pipes River: Pairing logic for odd groups
+        - Single Slide: Per-slide cooldown
+        - Big/Small Pipes: Exact capacity batching (shared _start_exact_batch)
+        - Wave/Kids Pool: Capacity-based entry
+        - Snorkel Tour: Instructor availability
+        """
+        pass
+
+    def _start_by_capacity(self, simulation, current_time):
+        """Admit waiting groups (express first) while they fit the facility's capacity."""
+        entered_anyone = True
+        while entered_anyone and (self.queue_express or self.queue_regular):
+            # Try express queue first
+            entered_anyone = self._admit_first_fitting(simulation, self.queue_express, current_time)
+
+            # Try regular queue if express didn't enter anyone
+            if not entered_anyone:
+                entered_anyone = self._admit_first_fitting(simulation, self.queue_regular, current_time)
+
+    def _admit_first_fitting(self, simulation, queue, current_time):
+        """
+        Start service for the first visitor in queue whose group fits the facility.
+        Scans the queue once in place; returns True if someone entered.
+        """
+        for i, (next_visitor, _) in enumerate(queue.server_queue):
+            if next_visitor is not None and self.can_enter(current_time, next_visitor.group_size):
+                break
+        else:
+            return False
+
+        if i == 0:  # Front entry is never a removed one
+            visitor, _ = queue.pop(current_time)
+        else:
+            queue.remove(next_visitor, current_time)
+            visitor = next_visitor
+
+        duration = self.get_service_duration()  # Each group stays its own sampled time
+        simulation._start_service(self, visitor, current_time + duration)
+        return True
+
+    def _start_exact_batch(self, simulation, current_time):
+        """Start one batch of exactly tube_size people when the tube is free."""
+        if self.can_enter(current_time):
+            batch = self.get_next_batch(current_time)
+            if batch:
+                duration = self.get_service_duration()  # Whole batch slides together
+                simulation._start_batch(self, batch, current_time + duration)
+
+    def _take_exact_batch(self, current_time):
+        """
+        Remove and return groups totaling exactly tube_size people.
+        Takes groups in order from the express queue, then the regular queue,
+        stopping at the first group that does not fit. The queues are only
+        peeked until an exact fit is found, so a failed attempt changes nothing.
+
+        Returns: list of visitors totaling exactly tube_size people, or empty list
+        """
+        tube_size = self.tube_size
+
+        # First, check if it's even possible (queues keep people counts)
+        queue_express = self.queue_express
+        queue_regular = self.queue_regular
+        if queue_express.total_people() + queue_regular.total_people() < tube_size:
+            return []  # Not enough people total
+
+        # Neither queue head fits on its own - nobody can start a batch
+        if ((not queue_express or queue_express[0].group_size > tube_size)
+                and (not queue_regular or queue_regular[0].group_size > tube_size)):
+            return []
+
+        batch = []
+        batch_size = 0
+        taken = []  # Groups to pop from each queue, front first
+
+        # Step 1: Take from express queue, then Step 2: fill remaining from regular queue
+        for queue in (queue_express, queue_regular):
+            count = 0
+            for visitor in queue:
+                if batch_size + visitor.group_size > tube_size:
+                    break  # This group too large, stop here
+                batch.append(visitor)
+                batch_size += visitor.group_size
+                count += 1
+                if batch_size == tube_size:
+                    break
+            taken.append((queue, count))
+            if batch_size == tube_size:
+                # Perfect! Commit the batch by popping the chosen groups
+                for chosen_queue, chosen in taken:
+                    for _ in range(chosen):
+                        chosen_queue.pop(current_time)
+                return batch
+
+        return []  # Can't make an exact batch right now
+
+    def on_visitor_finished(self, visitor, current_time, simulation, instructor_idx=None):
+        """
+        Facility-specific cleanup when a visitor finishes.
+        Called by EndFacilityEvent after the visitor leaves service (default: nothing).
+        """
+        pass
+
 
 # ============================================
 # RECEPTION (PARK ENTRANCE)
@@ -51,16 +184,24 @@ class Reception:
     def __init__(self, num_clerks=3):
         self.name = "Reception"
         self.num_clerks = num_clerks  # Number of service clerks (default: 3)
-        self.clerks_busy = [False] * num_clerks  # Track which clerks are busy
+        self.free_clerks_mask = (1 << num_clerks) - 1  # Bit i set = clerk i is free
         self.clerks_finish_time = [0] * num_clerks  # Track when each clerk finishes
 
 
     def get_available_clerk(self, current_time):
-        """Return index of available clerk, or None if all busy."""
-        for i in range(self.num_clerks):
-            if not self.clerks_busy[i]:
-                return i
-        return None
+        """Return index of the lowest-numbered free clerk, or None if all busy."""
+        free = self.free_clerks_mask
+        if not free:
+            return None
+        return (free & -free).bit_length() - 1  # Lowest set bit
+
+    def assign_clerk(self, clerk_index):
+        """Mark clerk as busy."""
+        self.free_clerks_mask &= ~(1 << clerk_index)
+
+    def release_clerk(self, clerk_index):
+        """Mark clerk as free."""
+        self.free_clerks_mask |= 1 << clerk_index
 
     def get_ticket_purchase_duration(self):
         """Duration for ticket purchase: Uniform[0.5, 2] minutes."""
@@ -95,19 +236,32 @@ class Pipes_River(Facility):
         """Activity duration: Uniform[20, 30] minutes."""
         return Sampling_Algorithms.pipes_river_duration()
 
+    def try_start(self, simulation, current_time):
+        """Start service with pairing logic for odd groups."""
+        entering = self.process_entry(current_time)
+        for group in entering:
+            duration = self.get_service_duration()
+            simulation._start_service(self, group, current_time + duration)
+
     def can_enter(self, current_time, group_size=1):
         """Check if there are available tubes."""
         return self.occupied_tubes < self.total_tubes
 
-    def find_odd_group_in_queue(self, queue_list):
+    def find_odd_group_in_queue(self, queue, start=0):
         """
-        Find first odd-sized group in queue.
-        Returns: index of group, or None if no odd groups found.
+        Find first odd-sized group in queue at position start or later.
+        A non-zero start only ever skips the odd group at the head that is
+        being paired, so the queue's odd-group count minus that one says
+        whether a partner exists; only then is the queue walked from start.
+        Returns: (index, group), or (None, None) if no odd groups found.
         """
-        for idx, visitor_group in enumerate(queue_list):
-            if visitor_group.group_size % 2 == 1:
-                return idx
-        return None
+        if not queue.odd_groups() - (1 if start else 0):
+            return None, None
+
+        for idx, visitor_group in enumerate(islice(queue, start, None), start):
+            if visitor_group.group_size & 1:  # Odd size
+                return idx, visitor_group
+        return None, None
 
     def process_entry(self, current_time):
         """
@@ -119,23 +273,20 @@ class Pipes_River(Facility):
         """
         entering_groups = []
 
-        made_progress = True  # Track if making progress
-
-        while self.occupied_tubes < self.total_tubes and made_progress:
-            made_progress = False  # Reset at start of each iteration
+        # Single pass: every admission continues the loop, every stall breaks out of it
+        while self.occupied_tubes < self.total_tubes:
             # Process express queue first (priority)
             if self.queue_express:
                 group = self.queue_express[0]
 
                 # Even group - enter directly
-                if group.group_size % 2 == 0:
+                if not group.group_size & 1:
                     tubes_used = group.group_size // self.people_per_tube
 
                     if self.occupied_tubes + tubes_used <= self.total_tubes:
                         self.queue_express.pop(current_time)
                         self.occupied_tubes += tubes_used
                         entering_groups.append(group)
-                        made_progress = True
                         continue
                     else:
                         break  # Not enough tubes available
@@ -143,20 +294,16 @@ class Pipes_River(Facility):
                 # Odd group - try to find a pair
                 else:
                     # Look for another odd group in express queue (skip first)
-                    express_list = list(self.queue_express)[1:]
-                    odd_idx_express = self.find_odd_group_in_queue(express_list)
+                    odd_idx_express, group2 = self.find_odd_group_in_queue(self.queue_express, start=1)
 
                     if odd_idx_express is not None:
-                        # Found pair in express queue
-                        odd_idx_express += 1  # Adjust for skipped first element
-                        group1, _ = self.queue_express.pop(current_time)
-                        group2 = list(self.queue_express)[odd_idx_express - 1]
-                        self.queue_express.remove(group2, current_time)
-
-                        total_size = group1.group_size + group2.group_size
-                        tubes_used = math.ceil(total_size / self.people_per_tube)
+                        # Found pair in express queue - decide before touching the queues
+                        total_size = group.group_size + group2.group_size
+                        tubes_used = -(-total_size // self.people_per_tube)  # Integer ceiling division
 
                         if self.occupied_tubes + tubes_used <= self.total_tubes:
+                            group1, _ = self.queue_express.pop(current_time)
+                            self.queue_express.remove(group2, current_time)
                             self.occupied_tubes += tubes_used
 
                             # Mark that these groups share tubes
@@ -167,28 +314,21 @@ class Pipes_River(Facility):
 
                             entering_groups.append(group1)
                             entering_groups.append(group2)
-                            made_progress = True
                             continue
                         else:
-                            # Not enough space, return to queue
-                            self.queue_express.insert(0, group1, current_time)
-                            self.queue_express.insert(odd_idx_express, group2, current_time)
-                            break
+                            break  # Not enough space, both stay in queue
 
                     # Look for odd group in regular queue
-                    regular_list = list(self.queue_regular)
-                    odd_idx_regular = self.find_odd_group_in_queue(regular_list)
+                    odd_idx_regular, group2 = self.find_odd_group_in_queue(self.queue_regular)
 
                     if odd_idx_regular is not None:
-                        # Found pair: express + regular
-                        group1, _ = self.queue_express.pop(current_time)
-                        group2 = list(self.queue_regular)[odd_idx_regular]
-                        self.queue_regular.remove(group2, current_time)
-
-                        total_size = group1.group_size + group2.group_size
-                        tubes_used = math.ceil(total_size / self.people_per_tube)
+                        # Found pair: express + regular - decide before touching the queues
+                        total_size = group.group_size + group2.group_size
+                        tubes_used = -(-total_size // self.people_per_tube)  # Integer ceiling division
 
                         if self.occupied_tubes + tubes_used <= self.total_tubes:
+                            group1, _ = self.queue_express.pop(current_time)
+                            self.queue_regular.remove(group2, current_time)
                             self.occupied_tubes += tubes_used
 
                             # Mark that these groups share tubes
@@ -199,13 +339,9 @@ class Pipes_River(Facility):
 
                             entering_groups.append(group1)
                             entering_groups.append(group2)
-                            made_progress = True
                             continue
                         else:
-                            # Not enough space, return to queue
-                            self.queue_express.insert(0, group1, current_time)
-                            self.queue_regular.insert(odd_idx_regular, group2, current_time)
-                            break
+                            break  # Not enough space, both stay in queue
 
                     # No pair found - wait for another odd group
                     break
@@ -215,34 +351,29 @@ class Pipes_River(Facility):
                 group = self.queue_regular[0]
 
                 # Even group - enter directly
-                if group.group_size % 2 == 0:
+                if not group.group_size & 1:
                     tubes_used = group.group_size // self.people_per_tube
 
                     if self.occupied_tubes + tubes_used <= self.total_tubes:
                         self.queue_regular.pop(current_time)
                         self.occupied_tubes += tubes_used
                         entering_groups.append(group)
-                        made_progress = True
                         continue
                     else:
                         break
 
                 # Odd group - try to find another odd group
                 else:
-                    regular_list = list(self.queue_regular)[1:]
-                    odd_idx = self.find_odd_group_in_queue(regular_list)
+                    odd_idx, group2 = self.find_odd_group_in_queue(self.queue_regular, start=1)
 
                     if odd_idx is not None:
-                        # Found pair in regular queue
-                        odd_idx += 1
-                        group1, _ = self.queue_regular.pop(current_time)
-                        group2 = list(self.queue_regular)[odd_idx - 1]
-                        self.queue_regular.remove(group2, current_time)
-
-                        total_size = group1.group_size + group2.group_size
-                        tubes_used = math.ceil(total_size / self.people_per_tube)
+                        # Found pair in regular queue - decide before touching the queues
+                        total_size = group.group_size + group2.group_size
+                        tubes_used = -(-total_size // self.people_per_tube)  # Integer ceiling division
 
                         if self.occupied_tubes + tubes_used <= self.total_tubes:
+                            group1, _ = self.queue_regular.pop(current_time)
+                            self.queue_regular.remove(group2, current_time)
                             self.occupied_tubes += tubes_used
 
                             # Mark that these groups share tubes
@@ -253,13 +384,9 @@ class Pipes_River(Facility):
 
                             entering_groups.append(group1)
                             entering_groups.append(group2)
-                            made_progress = True
                             continue
                         else:
-                            # Not enough space, return to queue
-                            self.queue_regular.insert(0, group1, current_time)
-                            self.queue_regular.insert(odd_idx, group2, current_time)
-                            break
+                            break  # Not enough space, both stay in queue
 
                     # No pair found - wait
                     break
@@ -268,25 +395,29 @@ class Pipes_River(Facility):
 
         return entering_groups
 
+    def on_visitor_finished(self, visitor, current_time, simulation, instructor_idx=None):
+        """Release tubes (handles shared tube logic)."""
+        self.release_tubes(visitor)
+
     def release_tubes(self, visitor):
         """
         Release tubes when visitors finish.
         For shared tubes, only release when LAST person exits.
         """
         # Check if this visitor shared a tube with someone
-        if hasattr(visitor, 'is_shared_tube') and visitor.is_shared_tube:
-            partner = getattr(visitor, 'tube_partner', None)
-            if partner:
+        if visitor.is_shared_tube:
+            partner = visitor.tube_partner
+            if partner is not None:
                 # Check if partner already exited (not in users_in_service)
                 if partner not in self.users_in_service:
                     # Partner already left, we are the last one - release the tube(s)
                     total_size = visitor.group_size + partner.group_size
-                    tubes_to_release = math.ceil(total_size / self.people_per_tube)
+                    tubes_to_release = -(-total_size // self.people_per_tube)  # Integer ceiling division
                     self.occupied_tubes -= tubes_to_release
                 # else: Partner still inside, don't release yet
         else:
             # Normal case: visitor(s) used their own tube(s)
-            tubes_to_release = math.ceil(visitor.group_size / self.people_per_tube)
+            tubes_to_release = -(-visitor.group_size // self.people_per_tube)  # Integer ceiling division
             self.occupied_tubes -= tubes_to_release
 
         # Ensure we never have negative tubes
@@ -315,6 +446,26 @@ class Single_Slide(Facility):
         """Slide duration: exactly 3 minutes."""
         return self.activity_duration
 
+    def try_start(self, simulation, current_time):
+        """Start service on any slide whose safety interval has passed."""
+        current_minutes = self._whole_seconds(current_time)  # Converted once for all entries
+        while self.queue_express or self.queue_regular:
+            slide_idx = self._slide_free_at(current_minutes)
+            if slide_idx is None:
+                break  # All slides on cooldown
+
+            # Priority: Express > Regular
+            visitor = None
+            if self.queue_express:
+                visitor, _ = self.queue_express.pop(current_time)
+            elif self.queue_regular:
+                visitor, _ = self.queue_regular.pop(current_time)
+
+            if visitor:
+                self.last_entry_times[slide_idx] = current_minutes  # As record_entry(), already whole seconds
+                duration = self.get_service_duration()
+                simulation._start_service(self, visitor, current_time + duration)
+
     def can_enter(self, current_time, group_size=1):
         """
         Check if can enter (capacity + safety interval).
@@ -323,28 +474,31 @@ class Single_Slide(Facility):
         if len(self.users_in_service) >= self.capacity:
             return False
 
-        # Convert current_time to minutes for comparison
-        current_minutes = current_time.hour * 60 + current_time.minute + current_time.second / 60
+        current_minutes = self._whole_seconds(current_time)
 
-        # Check if any slide is available (30 sec since last entry)
-        for last_time in self.last_entry_times:
-            if current_minutes - last_time >= self.safety_interval:
-                return True
-        return False
+        # Some slide is available (30 sec since last entry) iff the least recently used one is
+        return current_minutes - min(self.last_entry_times) >= self.safety_interval
 
     def get_available_slide(self, current_time):
         """Return index of available slide, or None if all slides on cooldown."""
-        current_minutes = current_time.hour * 60 + current_time.minute + current_time.second / 60
+        return self._slide_free_at(self._whole_seconds(current_time))
 
-        for i in range(self.num_slides):
-            if current_minutes - self.last_entry_times[i] >= self.safety_interval:
+    def _slide_free_at(self, current_minutes):
+        """Return index of first slide off cooldown at current_minutes (whole seconds), or None."""
+        safety_interval = self.safety_interval
+        for i, last_time in enumerate(self.last_entry_times):
+            if current_minutes - last_time >= safety_interval:
                 return i
         return None
 
     def record_entry(self, slide_index, current_time):
         """Record entry time for slide (for safety interval tracking)."""
-        current_minutes = current_time.hour * 60 + current_time.minute + current_time.second / 60
-        self.last_entry_times[slide_index] = current_minutes
+        self.last_entry_times[slide_index] = self._whole_seconds(current_time)
+
+    @staticmethod
+    def _whole_seconds(current_time):
+        """Truncate simulation minutes to whole seconds (entry times are tracked per second)."""
+        return int(current_time * 60) / 60
 
 
 # ============================================
@@ -366,6 +520,10 @@ class Big_Pipes_Slide(Facility):
         """Slide duration: Normal(μ=4.8, σ=1.8322) from data."""
         return Sampling_Algorithms.sample_big_pipes_slide_duration()
 
+    def try_start(self, simulation, current_time):
+        """Start a batch of exactly 8 people."""
+        self._start_exact_batch(simulation, current_time)
+
     def can_enter(self, current_time, group_size=1):
         """Can only enter when no one is currently sliding."""
         return len(self.users_in_service) == 0
@@ -376,61 +534,9 @@ class Big_Pipes_Slide(Facility):
         Strategy: Take groups sequentially until we reach exactly 8.
         If we can't reach exactly 8, don't process anyone (wait for more).
 
-        ✅ IMPORTANT: Must have EXACTLY 8 people, no more, no less.
-
         Returns: list of visitors totaling exactly 8 people, or empty list
         """
-        # First, check if it's even possible to make 8
-        total_in_queue = 0
-        for v in self.queue_express:
-            total_in_queue += v.group_size
-        for v in self.queue_regular:
-            total_in_queue += v.group_size
-
-        if total_in_queue < self.tube_size:
-            return []  # Not enough people total
-
-        # Try to build a batch of exactly 8
-        batch = []
-        batch_size = 0
-
-        # Step 1: Take from express queue
-        temp_express = []
-        while self.queue_express and batch_size < self.tube_size:
-            visitor = self.queue_express[0]
-            if batch_size + visitor.group_size <= self.tube_size:
-                v, t = self.queue_express.pop(current_time)
-                temp_express.append((v, t))
-                batch.append(v)
-                batch_size += v.group_size
-
-                if batch_size == self.tube_size:
-                    return batch  # Perfect!
-            else:
-                break  # This group too large, stop here
-
-        # Step 2: Fill remaining from regular queue
-        temp_regular = []
-        while self.queue_regular and batch_size < self.tube_size:
-            visitor = self.queue_regular[0]
-            if batch_size + visitor.group_size <= self.tube_size:
-                v, t = self.queue_regular.pop(current_time)
-                temp_regular.append((v, t))
-                batch.append(v)
-                batch_size += v.group_size
-
-                if batch_size == self.tube_size:
-                    return batch  # Perfect!
-            else:
-                break  # This group too large
-
-        # Didn't reach exactly 8 - rollback everyone
-        for v, t in reversed(temp_express):
-            self.queue_express.insert(0, v, t)
-        for v, t in reversed(temp_regular):
-            self.queue_regular.insert(0, v, t)
-
-        return []  # Can't make 8 right now
+        return self._take_exact_batch(current_time)
 
 
 # ============================================
@@ -452,6 +558,10 @@ class Small_Pipes_Slide(Facility):
         """Slide duration: Exponential(λ=2.10706) from data."""
         return Sampling_Algorithms.sample_small_pipes_slide_duration()
 
+    def try_start(self, simulation, current_time):
+        """Start a batch of exactly 3 people."""
+        self._start_exact_batch(simulation, current_time)
+
     def can_enter(self, current_time, group_size=1):
         """Can only enter when no one is currently sliding."""
         return len(self.users_in_service) == 0
@@ -462,61 +572,9 @@ class Small_Pipes_Slide(Facility):
         Strategy: Take groups sequentially until we reach exactly 3.
         If we can't reach exactly 3, don't process anyone (wait for more).
 
-        ✅ IMPORTANT: Must have EXACTLY 3 people, no more, no less.
-
         Returns: list of visitors totaling exactly 3 people, or empty list
         """
-        # First, check if it's even possible to make 3
-        total_in_queue = 0
-        for v in self.queue_express:
-            total_in_queue += v.group_size
-        for v in self.queue_regular:
-            total_in_queue += v.group_size
-
-        if total_in_queue < self.tube_size:
-            return []  # Not enough people total
-
-        # Try to build a batch of exactly 3
-        batch = []
-        batch_size = 0
-
-        # Step 1: Take from express queue
-        temp_express = []
-        while self.queue_express and batch_size < self.tube_size:
-            visitor = self.queue_express[0]
-            if batch_size + visitor.group_size <= self.tube_size:
-                v, t = self.queue_express.pop(current_time)
-                temp_express.append((v, t))
-                batch.append(v)
-                batch_size += v.group_size
-
-                if batch_size == self.tube_size:
-                    return batch  # Perfect!
-            else:
-                break  # This group too large, stop here
-
-        # Step 2: Fill remaining from regular queue
-        temp_regular = []
-        while self.queue_regular and batch_size < self.tube_size:
-            visitor = self.queue_regular[0]
-            if batch_size + visitor.group_size <= self.tube_size:
-                v, t = self.queue_regular.pop(current_time)
-                temp_regular.append((v, t))
-                batch.append(v)
-                batch_size += v.group_size
-
-                if batch_size == self.tube_size:
-                    return batch  # Perfect!
-            else:
-                break  # This group too large
-
-        # Didn't reach exactly 3 - rollback everyone
-        for v, t in reversed(temp_express):
-            self.queue_express.insert(0, v, t)
-        for v, t in reversed(temp_regular):
-            self.queue_regular.insert(0, v, t)
-
-        return []  # Can't make 3 right now
+        return self._take_exact_batch(current_time)
 
 
 # ============================================
@@ -527,20 +585,23 @@ class Waves_Pool(Facility):
     """
     Wave pool - capacity 80 people (or 120 with upgrade).
     Age 12+, multiple visitors can use simultaneously.
-    Duration sampled using Acceptance-Rejection algorithm.
+    Duration sampled using Inverse Transform method.
     """
 
     def __init__(self, capacity=80):
         super().__init__(name="Wave Pool", capacity=capacity, age_limit=12, adrenalin_level=3)
 
     def get_service_duration(self):
-        """Duration sampled using acceptance-rejection algorithm."""
+        """Duration sampled using inverse transform method."""
         return Sampling_Algorithms.get_wave_pool_duration()
 
+    def try_start(self, simulation, current_time):
+        """Capacity-based entry."""
+        self._start_by_capacity(simulation, current_time)
+
     def can_enter(self, current_time, group_size=1):
         """Check if pool has space for this group."""
-        current_occupancy = sum(v.group_size for v in self.users_in_service)
-        return current_occupancy + group_size <= self.capacity
+        return self.people_in_service + group_size <= self.capacity
 
 
 # ============================================
@@ -564,10 +625,13 @@ class Kids_Pool(Facility):
         """
         return Sampling_Algorithms.sample_kids_pool_duration()
 
+    def try_start(self, simulation, current_time):
+        """Capacity-based entry."""
+        self._start_by_capacity(simulation, current_time)
+
     def can_enter(self, current_time, group_size=1):
         """Check if pool has space for this group."""
-        current_occupancy = sum(v.group_size for v in self.users_in_service)
-        return current_occupancy + group_size <= self.capacity
+        return self.people_in_service + group_size <= self.capacity
 
 
 # ============================================
@@ -588,55 +652,87 @@ class Snorkel_Tour(Facility):
         self.num_instructors = num_instructors
         self.tour_capacity = 30  # Max people per tour
 
-        # Track instructor states
-        self.instructor_states = []
-        for i in range(num_instructors):
-            self.instructor_states.append({
-                'available': True,  # Can start new tour
-                'on_tour': False,  # Currently leading tour
-                'on_break': False,  # On 30-min break after tour
-                'on_lunch': False,  # On lunch break (13:00-14:00)
-                'finish_time': 0  # Time when current activity finishes (in minutes)
-            })
+        # Track instructor states (parallel lists indexed by instructor)
+        self.instructor_status = [INSTRUCTOR_AVAILABLE] * num_instructors  # One of INSTRUCTOR_*
+        self.instructor_finish_time = [0] * num_instructors  # Time when current activity finishes (in minutes)
 
     def get_service_duration(self):
         """Tour duration: Normal(30, 10) minutes."""
         return Sampling_Algorithms.sample_snorkel_tour_duration()
 
+    def try_start(self, simulation, current_time):
+        """Start a tour (up to 30 people) when an instructor is available."""
+        instructor_idx = self.get_available_instructor(current_time)
+        if instructor_idx is not None and (self.queue_express or self.queue_regular):
+            tour_group = []
+            tour_size = 0
+
+            # Fill tour up to capacity (30 people) in one pass over the queue heads
+            queue_express = self.queue_express
+            queue_regular = self.queue_regular
+            capacity = self.tour_capacity
+            while tour_size < capacity:
+                # Priority: Express > Regular
+                queue = queue_express if queue_express else queue_regular
+                if not queue:
+                    break
+
+                visitor = queue[0]
+                if tour_size + visitor.group_size > capacity:
+                    break  # Group too large
+
+                queue.pop(current_time)
+                tour_group.append(visitor)
+                tour_size += visitor.group_size
+
+            # Start tour if we have at least one visitor
+            if tour_group:
+                duration = self.get_service_duration()
+                self.start_tour(instructor_idx, current_time, duration)
+                end_time = current_time + duration  # Whole tour ends together
+                for visitor in tour_group:
+                    simulation._start_service(self, visitor, end_time, instructor_idx)
+
     def get_available_instructor(self, current_time):
         """
         Return index of available instructor, or None if all busy.
         ✅ FIXED: Check if current time is in restricted period (12:20-13:00 or 13:00-14:00).
         """
-        current_minutes = current_time.hour * 60 + current_time.minute
+        current_minutes = int(current_time % MINUTES_PER_DAY)
 
         # ✅ CRITICAL: No tours can start between 12:20-14:00
         # 12:20-13:00: Buffer to prevent tours from running into lunch
         # 13:00-14:00: Mandatory lunch break
-        if (12 * 60 + 20) <= current_minutes < (14 * 60):  # 12:20 to 14:00
+        if TOUR_CUTOFF_MIN <= current_minutes < LUNCH_END_MIN:  # 12:20 to 14:00
             return None  # No instructor available during restricted hours
 
-        for i, state in enumerate(self.instructor_states):
-            if state['available'] and current_minutes >= state['finish_time']:
+        status = self.instructor_status
+        finish_time = self.instructor_finish_time
+        for i in range(self.num_instructors):
+            if status[i] == INSTRUCTOR_AVAILABLE and current_minutes >= finish_time[i]:
                 return i
         return None
 
     def start_tour(self, instructor_idx, current_time, tour_duration):
         """Start a tour with given instructor."""
-        current_minutes = current_time.hour * 60 + current_time.minute
-        self.instructor_states[instructor_idx]['available'] = False
-        self.instructor_states[instructor_idx]['on_tour'] = True
-        self.instructor_states[instructor_idx]['finish_time'] = current_minutes + tour_duration
+        current_minutes = int(current_time % MINUTES_PER_DAY)
+        self.instructor_status[instructor_idx] = INSTRUCTOR_ON_TOUR
+        self.instructor_finish_time[instructor_idx] = current_minutes + tour_duration
 
     def finish_tour(self, instructor_idx, current_time):
         """
         Finish tour and send instructor on break.
         After break, instructor goes to lunch if it's lunch time (13:00-14:00).
         """
-        current_minutes = current_time.hour * 60 + current_time.minute
-        self.instructor_states[instructor_idx]['on_tour'] = False
-        self.instructor_states[instructor_idx]['on_break'] = True
-        self.instructor_states[instructor_idx]['finish_time'] = current_minutes + 30  # 30 min break
+        current_minutes = int(current_time % MINUTES_PER_DAY)
+        self.instructor_status[instructor_idx] = INSTRUCTOR_ON_BREAK
+        self.instructor_finish_time[instructor_idx] = current_minutes + 30  # 30 min break
+
+    def on_visitor_finished(self, visitor, current_time, simulation, instructor_idx=None):
+        """Send instructor on a 30 min break after the tour ends (once, on the first visitor out)."""
+        if instructor_idx is not None and self.instructor_status[instructor_idx] == INSTRUCTOR_ON_TOUR:
+            self.finish_tour(instructor_idx, current_time)
+            simulation.schedule_instructor_break_end(self, instructor_idx, current_time + 30)
 
     def finish_break(self, instructor_idx, current_time):
         """
@@ -644,31 +740,27 @@ class Snorkel_Tour(Facility):
         If it's lunch time (13:00-14:00), go to lunch.
         Otherwise, become available.
 
+        Returns: minutes of lunch left (until 14:00), or 0 if not going to lunch.
         NOTE: If going to lunch, Event.py must create InstructorLunchEndEvent!
         """
-        self.instructor_states[instructor_idx]['on_break'] = False
-
         # Check if it's lunch time (13:00-14:00)
-        hour = current_time.hour
-        if 13 <= hour < 14:
+        current_minutes = int(current_time % MINUTES_PER_DAY)
+        if LUNCH_START_MIN <= current_minutes < LUNCH_END_MIN:
             # It's lunch time - go to lunch
-            current_minutes = current_time.hour * 60 + current_time.minute
-            self.instructor_states[instructor_idx]['on_lunch'] = True
+            self.instructor_status[instructor_idx] = INSTRUCTOR_ON_LUNCH
             # Lunch ends at 14:00, so calculate remaining time until 14:00
-            lunch_end = 14 * 60  # 14:00 in minutes
-            remaining_lunch_time = lunch_end - current_minutes
-            self.instructor_states[instructor_idx]['finish_time'] = current_minutes + remaining_lunch_time
-            # Return True to signal that lunch end event should be created
-            return True  # ✅ SIGNAL: Create lunch end event!
+            remaining_lunch_time = LUNCH_END_MIN - current_minutes
+            self.instructor_finish_time[instructor_idx] = current_minutes + remaining_lunch_time
+            # Non-zero return signals that lunch end event should be created
+            return remaining_lunch_time  # ✅ SIGNAL: Create lunch end event!
         else:
             # Not lunch time - become available
-            self.instructor_states[instructor_idx]['available'] = True
-            return False
+            self.instructor_status[instructor_idx] = INSTRUCTOR_AVAILABLE
+            return 0
 
     def finish_lunch(self, instructor_idx):
         """Instructor finishes lunch and becomes available."""
-        self.instructor_states[instructor_idx]['on_lunch'] = False
-        self.instructor_states[instructor_idx]['available'] = True
+        self.instructor_status[instructor_idx] = INSTRUCTOR_AVAILABLE
 
 
 # ============================================
@@ -725,19 +817,23 @@ class Pizza_Restaurant(Restaurant):
     Price: 40₪ individual, 100₪ family tray.
     """
 
+    PREP_MIN, PREP_MAX = 4, 6  # Preparation time bounds (minutes per order)
+    INDIVIDUAL_PRICE = 40
+    FAMILY_TRAY_PRICE = 100
+
     def __init__(self):
         super().__init__(name="Pizza", service_stations=1)
 
     def get_preparation_time(self, visitor):
         """Uniform[4, 6] minutes per order."""
-        return Sampling_Algorithms.sample_uniform(4, 6)
+        return Sampling_Algorithms.sample_uniform(self.PREP_MIN, self.PREP_MAX)
 
     def get_price(self, visitor):
         """Individual 40₪, Family tray 100₪."""
         if visitor.group_size == 1:
-            return 40
+            return self.INDIVIDUAL_PRICE
         else:
-            return 100  # Family tray
+            return self.FAMILY_TRAY_PRICE
 
 
 class Burger_Restaurant(Restaurant):
@@ -747,16 +843,19 @@ class Burger_Restaurant(Restaurant):
     Price: 100₪ per person (burger + fries + drink).
     """
 
+    PREP_MIN, PREP_MAX = 3, 4  # Preparation time bounds (minutes per person)
+    PRICE_PER_PERSON = 100
+
     def __init__(self):
         super().__init__(name="Burger", service_stations=1)
 
     def get_preparation_time(self, visitor):
         """Uniform[3, 4] minutes per person."""
-        return Sampling_Algorithms.sample_uniform(3, 4)
+        return Sampling_Algorithms.sample_uniform(self.PREP_MIN, self.PREP_MAX)
 
     def get_price(self, visitor):
         """100₪ per person."""
-        return 100 * visitor.group_size
+        return self.PRICE_PER_PERSON * visitor.group_size
 
 
 class Salad_Restaurant(Restaurant):
@@ -766,13 +865,16 @@ class Salad_Restaurant(Restaurant):
     Price: 65₪ per person (salad + drink).
     """
 
+    PREP_MIN, PREP_MAX = 3, 7  # Preparation time bounds (minutes per person)
+    PRICE_PER_PERSON = 65
+
     def __init__(self):
         super().__init__(name="Salad", service_stations=1)
 
     def get_preparation_time(self, visitor):
         """Uniform[3, 7] minutes per person."""
-        return Sampling_Algorithms.sample_uniform(3, 7)
+        return Sampling_Algorithms.sample_uniform(self.PREP_MIN, self.PREP_MAX)
 
     def get_price(self, visitor):
         """65₪ per person."""
-        return 65 * visitor.group_size
\ No newline at end of file
+        return self.PRICE_PER_PERSON * visitor.group_size
\ No newline at end of file
@@ -1,17 +1,58 @@
+import bisect
+import functools
 import math
 import random
 
+import numpy as np
+
+
+# Discrete distributions as (upper CDF bounds, values); the last value takes the rest
+KIDS_CDF = ((0.2, 0.4, 0.6, 0.8), (1, 2, 3, 4, 5))  # Discrete Uniform[1,5], u < bound
+TEEN_GROUP_CDF = ((0.2, 0.4, 0.65, 0.9), (2, 3, 4, 5, 6))  # u <= bound
+RESTAURANT_CDF = ((3.0 / 8.0, 3.0 / 8.0 + 1.0 / 4.0), ("burger", "pizza", "salad"))  # u < bound
+
+# Photo packages by final rating: (tier lower bounds, (package_type, price) per tier)
+PHOTO_TIERS = ((6, 7.5, 8.5), ((None, 0), ("1_photo", 20), ("10_photos", 100), ("10_photos_video", 120)))
+
 
 class Sampling_Algorithms:
     """
     Collection of sampling algorithms for simulation.
     Implements various probability distributions using:
     - Inverse Transform Method
-    - Box-Muller Transform (for normal distribution)
-    - Acceptance-Rejection Algorithm
+    - Standard normal scaling (NumPy's Ziggurat generator, for normal distribution)
     - Composition Method
     """
 
+    # Generators behind every draw (global random / np.random until seed() is given a seed)
+    _py_rng = random
+    _np_rng = np.random
+
+    @staticmethod
+    def seed(seed=None):
+        """
+        Select the random number generators for all sampling methods.
+        With a seed, draws come from a private NumPy Generator (PCG64) and a
+        random.Random, both derived from one SeedSequence, so a run is
+        reproducible without touching global RNG state. Passing a spawned
+        SeedSequence (SeedSequence(root).spawn(n)) gives each parallel worker
+        its own independent streams. With None, the global random / np.random
+        state is used (seed those directly). Buffered draws are discarded
+        either way.
+
+        Args:
+            seed: Integer seed, np.random.SeedSequence, or None for the global generators
+        """
+        if seed is None:
+            Sampling_Algorithms._py_rng = random
+            Sampling_Algorithms._np_rng = np.random
+        else:
+            seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+            Sampling_Algorithms._np_rng = np.random.Generator(np.random.PCG64(seed_seq))
+            # Scalar draws (random.random is much cheaper per call than Generator.random)
+            Sampling_Algorithms._py_rng = random.Random(int(seed_seq.generate_state(1)[0]))
+        Sampling_Algorithms.reset_streams()
+
     # ============================================
     # BASIC MATHEMATICAL ALGORITHMS
     # ============================================
@@ -28,7 +69,7 @@ class Sampling_Algorithms:
         Returns:
             Random value in [a, b]
         """
-        u = random.random()  # U(0,1)
+        u = Sampling_Algorithms._py_rng.random()  # U(0,1)
         return a + (b - a) * u
 
     @staticmethod
@@ -42,13 +83,15 @@ class Sampling_Algorithms:
         Returns:
             Random value from exponential distribution
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return -math.log(1 - u) / lambda_param
+        u = Sampling_Algorithms._py_rng.random()  # U(0,1)
+        return -math.log1p(-u) / lambda_param  # log1p keeps precision for small u
 
     @staticmethod
     def sample_normal(mu, sigma):
         """
-        Sample from Normal(mu, sigma) using Box-Muller transform.
+        Sample from Normal(mu, sigma) by scaling a standard normal draw.
+        The draw comes from NumPy's C generator (Ziggurat method once seeded),
+        which avoids the log/sqrt/cos of Box-Muller.
 
         Args:
             mu: Mean
@@ -57,10 +100,79 @@ class Sampling_Algorithms:
         Returns:
             Random value from normal distribution
         """
-        u1 = Sampling_Algorithms.sample_uniform(0, 1)
-        u2 = Sampling_Algorithms.sample_uniform(0, 1)
-        z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-        return mu + sigma * z
+        return mu + sigma * Sampling_Algorithms._np_rng.standard_normal()
+
+    # ============================================
+    # VECTORIZED BATCH ALGORITHMS
+    # ============================================
+
+    @staticmethod
+    def sample_uniform_batch(a, b, n):
+        """
+        Sample n values from Uniform(a, b) using inverse transform method.
+        One vectorized NumPy call instead of n Python-level calls.
+
+        Returns:
+            NumPy array of n values in [a, b]
+        """
+        u = Sampling_Algorithms._np_rng.random(n)
+        return a + (b - a) * u
+
+    @staticmethod
+    def sample_exponential_batch(lambda_param, n):
+        """
+        Sample n values from Exponential(lambda) using inverse transform method.
+
+        Returns:
+            NumPy array of n values from exponential distribution
+        """
+        u = Sampling_Algorithms._np_rng.random(n)
+        return np.log1p(-u) * (-1.0 / lambda_param)  # One reciprocal per batch; log1p keeps precision for small u
+
+    @staticmethod
+    def sample_normal_batch(mu, sigma, n):
+        """
+        Sample n values from Normal(mu, sigma) by scaling standard normal draws.
+        One vectorized NumPy call (Ziggurat method once seeded).
+
+        Returns:
+            NumPy array of n values from normal distribution
+        """
+        return mu + sigma * Sampling_Algorithms._np_rng.standard_normal(n)
+
+    @staticmethod
+    def sample_bernoulli_batch(p, n):
+        """
+        Sample n yes/no decisions, each True with probability p.
+
+        Returns:
+            NumPy boolean array of n decisions
+        """
+        return Sampling_Algorithms._np_rng.random(n) <= p
+
+    @staticmethod
+    def sample_categorical_batch(cdf_table, n):
+        """
+        Sample n outcomes of a discrete distribution given as (bounds, values),
+        with outcome i taken when bounds[i-1] <= u < bounds[i].
+        The inverse-CDF search runs over the whole batch in one NumPy call.
+
+        Returns:
+            NumPy object array of n values
+        """
+        bounds, values = cdf_table
+        u = Sampling_Algorithms._np_rng.random(n)
+        return np.array(values, dtype=object)[np.searchsorted(bounds, u, side='right')]
+
+    @staticmethod
+    def reset_streams():
+        """
+        Discard all buffered draws.
+        Called when a new simulation starts, so seeding NumPy before creating
+        the simulation reproduces the same run.
+        """
+        for stream in _STREAMS:
+            stream.reset()
 
     # ============================================
     # VISITOR GENERATION
@@ -75,17 +187,8 @@ class Sampling_Algorithms:
         Returns:
             Number of kids (1-5, equal probability)
         """
-        u = random.random()
-        if u < 0.2:
-            return 1
-        elif u < 0.4:
-            return 2
-        elif u < 0.6:
-            return 3
-        elif u < 0.8:
-            return 4
-        else:
-            return 5
+        bounds, values = KIDS_CDF
+        return values[bisect.bisect_right(bounds, _VISITOR_UNIFORM.next())]
 
     @staticmethod
     def get_kid_age():
@@ -96,7 +199,7 @@ class Sampling_Algorithms:
         Returns:
             Kid age in years (continuous, 2-18)
         """
-        return Sampling_Algorithms.sample_uniform(2, 18)
+        return 2 + (18 - 2) * _VISITOR_UNIFORM.next()
 
     @staticmethod
     def sample_family_interarrival_time():
@@ -110,7 +213,7 @@ class Sampling_Algorithms:
         """
         # Rate = 40 per hour = 40/60 per minute = 2/3 per minute
         # Mean time between arrivals = 60/40 = 1.5 minutes
-        return Sampling_Algorithms.sample_exponential(40 / 60)
+        return _FAMILY_INTERARRIVAL.next()
 
     @staticmethod
     def get_family_departure_time():
@@ -121,7 +224,7 @@ class Sampling_Algorithms:
         Returns:
             Departure hour (16.0 to 19.0)
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
+        u = _VISITOR_UNIFORM.next()
         return 3 * math.sqrt(u) + 16
 
     @staticmethod
@@ -136,17 +239,8 @@ class Sampling_Algorithms:
         Returns:
             Group size (2-6 people)
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        if u <= 0.2:
-            return 2
-        elif u <= 0.4:
-            return 3
-        elif u <= 0.65:
-            return 4
-        elif u <= 0.9:
-            return 5
-        else:
-            return 6
+        bounds, values = TEEN_GROUP_CDF
+        return values[bisect.bisect_left(bounds, _VISITOR_UNIFORM.next())]
 
     @staticmethod
     def sample_teens_group_interarrival_time():
@@ -158,7 +252,7 @@ class Sampling_Algorithms:
         Returns:
             Inter-arrival time in MINUTES
         """
-        return Sampling_Algorithms.sample_exponential(500 / 360)
+        return _TEENS_INTERARRIVAL.next()
 
     @staticmethod
     def sample_single_visitor_interarrival_time():
@@ -169,7 +263,7 @@ class Sampling_Algorithms:
         Returns:
             Inter-arrival time in MINUTES
         """
-        return Sampling_Algorithms.sample_exponential(40 / 60)
+        return _SINGLE_INTERARRIVAL.next()
 
     @staticmethod
     def should_buy_express_on_entry():
@@ -180,7 +274,7 @@ class Sampling_Algorithms:
         Returns:
             True if buying express pass, False otherwise
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
+        u = _VISITOR_UNIFORM.next()
         return u <= 0.25
 
     # ============================================
@@ -196,7 +290,7 @@ class Sampling_Algorithms:
         Returns:
             Activity duration in minutes
         """
-        return Sampling_Algorithms.sample_uniform(20, 30)
+        return _PIPES_RIVER_DURATION.next()
 
     @staticmethod
     def sample_big_pipes_slide_duration():
@@ -208,9 +302,7 @@ class Sampling_Algorithms:
         Returns:
             Slide duration in minutes
         """
-        mu = 4.8
-        sigma = 1.8322
-        return Sampling_Algorithms.sample_normal(mu, sigma)
+        return _BIG_PIPES_SLIDE_DURATION.next()
 
     @staticmethod
     def sample_small_pipes_slide_duration():
@@ -222,8 +314,7 @@ class Sampling_Algorithms:
         Returns:
             Slide duration in minutes
         """
-        lambda_param = 2.10706
-        return Sampling_Algorithms.sample_exponential(lambda_param)
+        return _SMALL_PIPES_SLIDE_DURATION.next()
 
     # ============================================
     # COMPLEX SAMPLING ALGORITHMS
@@ -232,7 +323,17 @@ class Sampling_Algorithms:
     @staticmethod
     def get_wave_pool_duration():
         """
-        Sample Wave Pool duration using Acceptance-Rejection algorithm.
+        Sample Wave Pool duration (inverse transform, drawn in batches).
+
+        Returns:
+            Pool duration in minutes
+        """
+        return _WAVE_POOL_DURATION.next()
+
+    @staticmethod
+    def sample_wave_pool_duration_batch(n):
+        """
+        Sample n Wave Pool durations using inverse transform.
 
         PDF:
         - f(x) = x/2700, 0 ≤ x ≤ 10
@@ -240,62 +341,52 @@ class Sampling_Algorithms:
         - f(x) = (60-x)/2700 + 1/30, 30 ≤ x ≤ 50
         - f(x) = (60-x)/2700, 50 < x ≤ 60
 
+        It integrates to 46/54, so with
+        w = 4600 * u (mass in units of 1/5400) the CDF inverts in closed form:
+        - w ≤ 100: x = sqrt(w)  (0 to 10)
+        - w ≤ 4500: x = 150 - sqrt(14500 - w)  (30 to 50)
+        - else: x = 60 - sqrt(4600 - w)  (50 to 60)
+        One uniform per duration, no rejected draws.
+
         Returns:
-            Pool duration in minutes
+            NumPy array of n pool durations in minutes
         """
-        # Maximum of f(x)
-        M = 2.0 / 45.0
-
-        while True:
-            # Generate candidate
-            x = Sampling_Algorithms.sample_uniform(0, 60)
+        w = 4600 * Sampling_Algorithms._np_rng.random(n)
+        return np.where(w <= 100, np.sqrt(w),
+                        np.where(w <= 4500, 150 - np.sqrt(14500 - w), 60 - np.sqrt(4600 - w)))
 
-            # Evaluate PDF at x
-            if 0 <= x <= 10:
-                f_x = x / 2700.0
-            elif 10 < x < 30:
-                f_x = 0
-            elif 30 <= x <= 50:
-                f_x = (60 - x) / 2700.0 + 1.0 / 30.0
-            elif 50 < x <= 60:
-                f_x = (60 - x) / 2700.0
-            else:
-                f_x = 0
+    @staticmethod
+    def sample_kids_pool_duration():
+        """
+        Sample Kids Pool stay duration (inverse transform, drawn in batches).
 
-            # Accept/reject
-            u = Sampling_Algorithms.sample_uniform(0, 1)
-            if u <= f_x / M:
-                return x
+        Returns:
+            Pool duration in minutes
+        """
+        return _KIDS_POOL_DURATION.next()
 
     @staticmethod
-    def sample_kids_pool_duration():
+    def sample_kids_pool_duration_batch(n):
         """
-        Sample Kids Pool stay duration using inverse transform.
+        Sample n Kids Pool stay durations using inverse transform.
 
         PDF (piecewise):
         - f(x) = 16/3(x-1), 1 ≤ x < 1.25
         - f(x) = 4/3, 1.25 ≤ x < 1.75
         - f(x) = 16/3(2-x), 1.75 ≤ x ≤ 2
 
-        Formula is in hours, result returned in minutes.
+        Formula is in hours, result returned in minutes. All three parts are
+        evaluated over the whole array and the one matching u is selected.
 
         Returns:
-            Pool duration in minutes
+            NumPy array of n pool durations in minutes
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
+        u = Sampling_Algorithms._np_rng.random(n)
 
-        # Select formula part based on u value
-        if 0 <= u < 1 / 6:
-            # First range (1 to 1.25 hours)
-            duration_hours = 1 + math.sqrt((3 * u) / 8)
-
-        elif 1 / 6 <= u < 5 / 6:
-            # Middle range (1.25 to 1.75 hours)
-            duration_hours = 0.75 * u + 1.125
-
-        else:
-            # Last range (1.75 to 2 hours)
-            duration_hours = 2 - math.sqrt((3 * (1 - u)) / 8)
+        first = 1 + np.sqrt((3 * u) / 8)  # First range (1 to 1.25 hours), u < 1/6
+        middle = 0.75 * u + 1.125  # Middle range (1.25 to 1.75 hours), u < 5/6
+        last = 2 - np.sqrt((3 * (1 - u)) / 8)  # Last range (1.75 to 2 hours)
+        duration_hours = np.where(u < 1 / 6, first, np.where(u < 5 / 6, middle, last))
 
         # Convert hours to minutes
         return duration_hours * 60
@@ -313,7 +404,7 @@ class Sampling_Algorithms:
         Returns:
             Purchase time in minutes
         """
-        return Sampling_Algorithms.sample_uniform(0.5, 2)
+        return _TICKET_PURCHASE_TIME.next()
 
     @staticmethod
     def sample_wristband_time():
@@ -324,7 +415,7 @@ class Sampling_Algorithms:
         Returns:
             Reception time in minutes
         """
-        return Sampling_Algorithms.sample_exponential(1.0 / 2.0)
+        return _WRISTBAND_TIME.next()
 
     @staticmethod
     def sample_restaurant_service_time():
@@ -335,7 +426,7 @@ class Sampling_Algorithms:
         Returns:
             Service time in minutes
         """
-        return Sampling_Algorithms.sample_normal(5, 1.5)
+        return _RESTAURANT_SERVICE_TIME.next()
 
     @staticmethod
     def sample_meal_duration():
@@ -346,7 +437,7 @@ class Sampling_Algorithms:
         Returns:
             Eating duration in minutes
         """
-        return Sampling_Algorithms.sample_uniform(15, 35)
+        return _MEAL_DURATION.next()
 
     @staticmethod
     def sample_snorkel_tour_duration():
@@ -357,7 +448,7 @@ class Sampling_Algorithms:
         Returns:
             Tour duration in minutes
         """
-        return Sampling_Algorithms.sample_normal(30, 10)
+        return _SNORKEL_TOUR_DURATION.next()
 
     # ============================================
     # VISITOR BEHAVIOR & DECISION-MAKING
@@ -372,8 +463,7 @@ class Sampling_Algorithms:
         Returns:
             True if buying express pass, False otherwise
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return u <= 0.6
+        return _TEENS_EXPRESS_AFTER_ABANDON.next()
 
     @staticmethod
     def had_good_experience():
@@ -384,13 +474,14 @@ class Sampling_Algorithms:
         Returns:
             True if good experience, False otherwise
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return u <= 0.5
+        return _GOOD_EXPERIENCE.next()
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def calculate_positive_rating(group_size, adrenaline_level):
         """
         Calculate rating increase after good experience.
+        Deterministic in two small integers, so results are cached.
 
         Formula: score = (GS-1)/5 * 0.3 + (A-1)/4 * 0.7
 
@@ -412,8 +503,7 @@ class Sampling_Algorithms:
         Returns:
             True if eating lunch, False otherwise
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return u <= 0.7
+        return _EAT_LUNCH.next()
 
     @staticmethod
     def choose_restaurant():
@@ -428,13 +518,7 @@ class Sampling_Algorithms:
         Returns:
             Restaurant choice: "burger", "pizza", or "salad"
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        if u < 3.0 / 8.0:
-            return "burger"
-        elif u < 3.0 / 8.0 + 1.0 / 4.0:
-            return "pizza"
-        else:
-            return "salad"
+        return _RESTAURANT_CHOICE.next()
 
     @staticmethod
     def is_meal_unsatisfactory():
@@ -445,8 +529,7 @@ class Sampling_Algorithms:
         Returns:
             True if meal unsatisfactory, False otherwise
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return u <= 0.1
+        return _MEAL_UNSATISFACTORY.next()
 
     @staticmethod
     def get_photo_purchase_decision(final_rating):
@@ -465,14 +548,8 @@ class Sampling_Algorithms:
         Returns:
             (package_type, price) tuple
         """
-        if final_rating < 6:
-            return None, 0
-        elif final_rating < 7.5:
-            return "1_photo", 20
-        elif final_rating < 8.5:
-            return "10_photos", 100
-        else:
-            return "10_photos_video", 120
+        bounds, packages = PHOTO_TIERS
+        return packages[bisect.bisect_right(bounds, final_rating)]
 
     @staticmethod
     def should_family_split():
@@ -483,8 +560,7 @@ class Sampling_Algorithms:
         Returns:
             True if splitting, False otherwise
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return u <= 0.6
+        return _FAMILY_SPLIT.next()
 
     @staticmethod
     def get_num_split_groups():
@@ -495,5 +571,85 @@ class Sampling_Algorithms:
         Returns:
             Number of subgroups (2 or 3)
         """
-        u = Sampling_Algorithms.sample_uniform(0, 1)
-        return 2 if u <= 0.5 else 3
\ No newline at end of file
+        return 2 if _SPLIT_INTO_TWO.next() else 3
+
+
+class SampleStream:
+    """
+    Buffered stream of random draws.
+    Fills a whole batch with one vectorized NumPy call and hands values out
+    one at a time, refilling when the batch is exhausted.
+    """
+
+    def __init__(self, batch_sampler, batch_size=1024):
+        self.batch_sampler = batch_sampler  # Function: n -> NumPy array of n draws
+        self.batch_size = batch_size
+        self.buffer = []  # Current batch (plain Python values)
+        self.index = 0  # Next value to hand out
+
+    def next(self):
+        """Return next draw, refilling the batch if needed."""
+        if self.index >= len(self.buffer):
+            self.buffer = self.batch_sampler(self.batch_size).tolist()
+            self.index = 0
+        value = self.buffer[self.index]
+        self.index += 1
+        return value
+
+    def reset(self):
+        """Discard remaining buffered draws."""
+        self.buffer = []
+        self.index = 0
+
+
+# ============================================
+# BUFFERED STREAMS
+# ============================================
+
+_FAMILY_INTERARRIVAL = SampleStream(lambda n: Sampling_Algorithms.sample_exponential_batch(40 / 60, n))
+_TEENS_INTERARRIVAL = SampleStream(lambda n: Sampling_Algorithms.sample_exponential_batch(500 / 360, n))
+_SINGLE_INTERARRIVAL = SampleStream(lambda n: Sampling_Algorithms.sample_exponential_batch(40 / 60, n))
+_GOOD_EXPERIENCE = SampleStream(lambda n: Sampling_Algorithms.sample_bernoulli_batch(0.5, n))
+_EAT_LUNCH = SampleStream(lambda n: Sampling_Algorithms.sample_bernoulli_batch(0.7, n))
+_MEAL_UNSATISFACTORY = SampleStream(lambda n: Sampling_Algorithms.sample_bernoulli_batch(0.1, n))
+_TEENS_EXPRESS_AFTER_ABANDON = SampleStream(lambda n: Sampling_Algorithms.sample_bernoulli_batch(0.6, n))
+_FAMILY_SPLIT = SampleStream(lambda n: Sampling_Algorithms.sample_bernoulli_batch(0.6, n))
+_SPLIT_INTO_TWO = SampleStream(lambda n: Sampling_Algorithms.sample_bernoulli_batch(0.5, n))  # Else three subgroups
+_RESTAURANT_CHOICE = SampleStream(lambda n: Sampling_Algorithms.sample_categorical_batch(RESTAURANT_CDF, n))
+_VISITOR_UNIFORM = SampleStream(lambda n: Sampling_Algorithms.sample_uniform_batch(0, 1, n))  # Visitor generation draws
+
+# Activity and service durations with fixed parameters
+_PIPES_RIVER_DURATION = SampleStream(lambda n: Sampling_Algorithms.sample_uniform_batch(20, 30, n))
+_BIG_PIPES_SLIDE_DURATION = SampleStream(lambda n: Sampling_Algorithms.sample_normal_batch(4.8, 1.8322, n))
+_SMALL_PIPES_SLIDE_DURATION = SampleStream(lambda n: Sampling_Algorithms.sample_exponential_batch(2.10706, n))
+_TICKET_PURCHASE_TIME = SampleStream(lambda n: Sampling_Algorithms.sample_uniform_batch(0.5, 2, n))
+_WRISTBAND_TIME = SampleStream(lambda n: Sampling_Algorithms.sample_exponential_batch(1.0 / 2.0, n))
+_RESTAURANT_SERVICE_TIME = SampleStream(lambda n: Sampling_Algorithms.sample_normal_batch(5, 1.5, n))
+_MEAL_DURATION = SampleStream(lambda n: Sampling_Algorithms.sample_uniform_batch(15, 35, n))
+_SNORKEL_TOUR_DURATION = SampleStream(lambda n: Sampling_Algorithms.sample_normal_batch(30, 10, n))
+_WAVE_POOL_DURATION = SampleStream(Sampling_Algorithms.sample_wave_pool_duration_batch)
+_KIDS_POOL_DURATION = SampleStream(Sampling_Algorithms.sample_kids_pool_duration_batch)
+
+_STREAMS = [
+    _FAMILY_INTERARRIVAL,
+    _TEENS_INTERARRIVAL,
+    _SINGLE_INTERARRIVAL,
+    _GOOD_EXPERIENCE,
+    _EAT_LUNCH,
+    _MEAL_UNSATISFACTORY,
+    _TEENS_EXPRESS_AFTER_ABANDON,
+    _FAMILY_SPLIT,
+    _SPLIT_INTO_TWO,
+    _RESTAURANT_CHOICE,
+    _VISITOR_UNIFORM,
+    _PIPES_RIVER_DURATION,
+    _BIG_PIPES_SLIDE_DURATION,
+    _SMALL_PIPES_SLIDE_DURATION,
+    _TICKET_PURCHASE_TIME,
+    _WRISTBAND_TIME,
+    _RESTAURANT_SERVICE_TIME,
+    _MEAL_DURATION,
+    _SNORKEL_TOUR_DURATION,
+    _WAVE_POOL_DURATION,
+    _KIDS_POOL_DURATION,
+]
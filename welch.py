@@ -0,0 +1,67 @@
+import numpy as np
+from scipy import stats
+
+
+def welch_report(means, variances, ns, preferred_if_negative, preferred_if_positive, alpha=0.1):
+    """
+    Print Welch confidence intervals for every pair of alternatives.
+    Uses Bonferroni correction (alpha / 6) and Welch-Satterthwaite degrees of freedom.
+
+    Args:
+        means: Mean of the measure for each alternative
+        variances: Variance (Standard Deviation squared) for each alternative
+        ns: Number of runs for each alternative
+        preferred_if_negative: Message when the whole interval is below 0
+        preferred_if_positive: Message when the whole interval is above 0
+        alpha: Overall significance level
+    """
+    means = np.asarray(means, dtype=float)
+    variances = np.asarray(variances, dtype=float)
+    ns = np.asarray(ns)
+
+    # Pairwise comparisons (upper-triangle index pairs: 1v2, 1v3, 2v3)
+    i, j = np.triu_indices(len(means), 1)
+    names = [f"Alternative {a + 1} vs Alternative {b + 1}" for a, b in zip(i, j)]
+
+    # Bonferroni correction
+    adjusted_alpha = alpha / 6
+
+    # All pairs at once
+    mean_diffs = means[i] - means[j]
+    var_over_n = variances / ns
+
+    # Calculate the standard error of the difference
+    standard_errors = np.sqrt(var_over_n[i] + var_over_n[j])
+
+    # Degrees of freedom
+    numerators = (var_over_n[i] + var_over_n[j])**2
+    denominators = (variances[i]**2) / ((ns[i]**2) * (ns[i] - 1)) + (variances[j]**2) / ((ns[j]**2) * (ns[j] - 1))
+    degrees_of_freedom = (numerators / denominators).astype(int)
+
+    # Critical t-values using adjusted alpha (one vectorized call)
+    t_crits = stats.t.ppf(1 - adjusted_alpha/2, degrees_of_freedom)
+
+    # Confidence intervals
+    margins_of_error = t_crits * standard_errors
+    ci_lowers = mean_diffs - margins_of_error
+    ci_uppers = mean_diffs + margins_of_error
+
+    # Print confidence intervals for each pair
+    for name, mean_diff, dof, t_crit, ci_lower, ci_upper in zip(
+            names, mean_diffs, degrees_of_freedom, t_crits, ci_lowers, ci_uppers):
+
+        # Output results
+        print(f"{name}:")
+        print("  Difference in means:", mean_diff)
+        print("  Degrees of Freedom (approx):", dof)
+        print("  Critical t-value:", t_crit)
+        print("  Confidence Interval: ({:.4f}, {:.4f})".format(ci_lower, ci_upper))
+
+        # Interpretation
+        if ci_upper < 0:
+            print("  Preferred Alternative:", preferred_if_negative)
+        elif ci_lower > 0:
+            print("  Preferred Alternative:", preferred_if_positive)
+        else:
+            print("  No significant difference between the alternatives.")
+        print()